@@ -1,12 +1,21 @@
 """YomiageBot Alpha - Discord Bot クライアント"""
 
+import asyncio
+import hashlib
+import json
 import logging
 import os
-from typing import Optional
+from contextlib import AsyncExitStack
+from typing import Optional, Dict
+import aiohttp
 import discord
 from discord.ext import commands
 from pathlib import Path
 
+from bot.utils.tts_api import TTSAPIClient
+from bot.utils.cache_manager import CacheManager
+from bot.utils.guild_state import GuildState
+
 logger = logging.getLogger(__name__)
 
 
@@ -51,9 +60,18 @@ class YomiageBotClient(commands.Bot):
         # キャッシュディレクトリを作成
         self.cache_dir.mkdir(exist_ok=True)
         
-        # ボイス再生用の設定
-        self.voice_clients_dict = {}  # ギルドID -> VoiceClient のマッピング
-        self.tts_queue = {}  # ギルドID -> 音声再生キューのマッピング
+        # TTS API 用の共有HTTPセッション（setup_hook で作成）
+        self.http_session: Optional[aiohttp.ClientSession] = None
+        
+        # 全Cogで共有する TTS API クライアント（setup_hook で開始し、close で停止）
+        self.tts_client: Optional[TTSAPIClient] = None
+        self._exit_stack = AsyncExitStack()
+        
+        # 全Cogで共有する音声キャッシュ（メモリキャッシュ・アクセス情報を一元管理）
+        self.cache_manager = CacheManager(cache_dir=str(self.cache_dir))
+        
+        # ギルドごとの状態（ボイスクライアント・読み上げキュー等）
+        self._guild_state: Dict[int, GuildState] = {}  # ギルドID -> GuildState
         
         logger.info(f"YomiageBotClient initialized: guild_id={debug_guild_id}, api_url={tts_api_url}")
     
@@ -61,6 +79,20 @@ class YomiageBotClient(commands.Bot):
         """Bot起動時のセットアップフック"""
         logger.info("Setting up YomiageBot...")
         
+        # 全Cogで共有するHTTPセッションを作成（接続を使い回す）
+        self.http_session = TTSAPIClient.create_session()
+        self.tts_client = await self._exit_stack.enter_async_context(
+            TTSAPIClient(api_url=self.tts_api_url, session=self.http_session)
+        )
+        
+        # 旧形式キャッシュの削除・期限切れキャッシュをクリーンアップし、定期処理を開始
+        try:
+            await self.cache_manager.migrate_if_needed()
+            await self.cache_manager.cleanup_expired_cache()
+        except Exception as e:
+            logger.warning(f"Cache cleanup failed: {e}")
+        self.cache_manager.start()
+        
         # Cog をロード
         try:
             await self.load_extension("bot.cogs.voice_manager")
@@ -77,21 +109,52 @@ class YomiageBotClient(commands.Bot):
         # デバッグサーバーでスラッシュコマンド同期（開発時のみ）
         if self.debug_guild_id:
             guild = discord.Object(id=self.debug_guild_id)
+            
+            # コマンド定義が前回同期時から変わっていなければ同期しない（1日あたりの同期回数制限対策）
+            hash_file = self.cache_dir / ".cmd_hash"
+            try:
+                previous_hash = hash_file.read_text(encoding='utf-8').strip()
+            except OSError:
+                previous_hash = None
+            
             try:
-                synced = await self.tree.sync(guild=guild)
-                logger.info(f"Synced {len(synced)} commands to debug guild {self.debug_guild_id}")
+                command_hash = self._compute_command_hash(guild)
+                if command_hash == previous_hash:
+                    logger.info(f"Command set unchanged, skipping sync to debug guild {self.debug_guild_id}")
+                else:
+                    synced = await self.tree.sync(guild=guild)
+                    logger.info(f"Synced {len(synced)} commands to debug guild {self.debug_guild_id}")
+                    hash_file.write_text(command_hash, encoding='utf-8')
             except Exception as e:
                 logger.error(f"Failed to sync commands to debug guild: {e}")
         
         logger.info("YomiageBot setup completed")
     
+    def _compute_command_hash(self, guild: discord.abc.Snowflake) -> str:
+        """
+        同期対象のスラッシュコマンド定義のハッシュを計算
+        
+        Args:
+            guild: 同期先のサーバー
+            
+        Returns:
+            コマンド定義（Discord へ送信する内容）のハッシュ
+        """
+        payload = {
+            "guild_id": guild.id,
+            "commands": [command.to_dict(self.tree) for command in self.tree.get_commands(guild=guild)]
+        }
+        encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str).encode('utf-8')
+        return hashlib.md5(encoded).hexdigest()
+    
     async def on_ready(self):
         """Bot準備完了時のイベント"""
         logger.info(f"YomiageBot logged in as {self.user} (ID: {self.user.id})")
         
-        # ボイスチャンネル接続状況を確認
+        # ボイスチャンネル接続状況を確認（ボイスクライアントのマッピングも再構築）
         connected_guilds = []
         for voice_client in self.voice_clients:
+            self.set_voice_client_for_guild(voice_client.guild.id, voice_client)
             connected_guilds.append(f"{voice_client.guild.name} (#{voice_client.channel.name})")
         
         if connected_guilds:
@@ -117,58 +180,69 @@ class YomiageBotClient(commands.Bot):
         """
         logger.info("Scanning voice channels for users...")
         
-        # 全サーバーのボイスチャンネルをスキャン
-        for guild in self.guilds:
-            try:
-                # 既にこのサーバーのボイスチャンネルに接続中の場合はスキップ
-                if guild.voice_client:
-                    logger.debug(f"Already connected to voice channel in {guild.name}, skipping scan")
-                    continue
-                
-                # ボイスチャンネルで人がいるチャンネルを検索
-                occupied_channels = []
-                for channel in guild.voice_channels:
-                    # Bot以外のユーザーがいるかチェック
-                    human_members = [member for member in channel.members if not member.bot]
-                    if human_members:
-                        occupied_channels.append((channel, len(human_members)))
-                        logger.debug(f"Found {len(human_members)} users in {channel.name} ({guild.name})")
-                
-                # 最も人数が多いチャンネルに参加
-                if occupied_channels:
-                    # 人数でソート（降順）
-                    occupied_channels.sort(key=lambda x: x[1], reverse=True)
-                    target_channel, user_count = occupied_channels[0]
-                    
-                    logger.info(f"Auto-joining voice channel: #{target_channel.name} in {guild.name} ({user_count} users)")
-                    
-                    try:
-                        # ボイスチャンネルに参加
-                        voice_client = await target_channel.connect()
-                        logger.info(f"Successfully joined {target_channel.name}")
-                        
-                        # VoiceManagerのCogがあれば挨拶音声を再生（Bot による参加挨拶）
-                        voice_manager = self.get_cog('VoiceManager')
-                        if voice_manager:
-                            # Bot自身の挨拶として簡単な音声合成・再生を実行
-                            try:
-                                await voice_manager._synthesize_and_play(guild.id, "参加しました", is_greeting=True)
-                                logger.debug("Played bot join greeting")
-                            except Exception as e:
-                                logger.error(f"Failed to play bot join greeting: {e}", exc_info=True)
-                        
-                    except discord.errors.ClientException as e:
-                        logger.error(f"Failed to join voice channel {target_channel.name}: {e}")
-                    except Exception as e:
-                        logger.error(f"Unexpected error joining {target_channel.name}: {e}", exc_info=True)
-                else:
-                    logger.debug(f"No occupied voice channels found in {guild.name}")
-                    
-            except Exception as e:
-                logger.error(f"Error scanning voice channels in {guild.name}: {e}")
+        # 全サーバーのボイスチャンネルを並行してスキャン（接続待ちを重ねる）
+        guilds = self.guilds
+        results = await asyncio.gather(
+            *(self._scan_one_guild(guild) for guild in guilds),
+            return_exceptions=True
+        )
+        
+        for guild, result in zip(guilds, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error scanning voice channels in {guild.name}: {result}")
         
         logger.info("Voice channel scan completed")
     
+    async def _scan_one_guild(self, guild: discord.Guild):
+        """
+        サーバーのボイスチャンネルをスキャンして、人がいる場合は自動参加
+        
+        Args:
+            guild: スキャン対象のサーバー
+        """
+        # 既にこのサーバーのボイスチャンネルに接続中の場合はスキップ
+        if guild.voice_client:
+            logger.debug(f"Already connected to voice channel in {guild.name}, skipping scan")
+            return
+        
+        # ボイスチャンネルで人がいるチャンネルを検索
+        occupied_channels = []
+        for channel in guild.voice_channels:
+            # Bot以外のユーザー数をカウント
+            human_count = sum(1 for member in channel.members if not member.bot)
+            if human_count:
+                occupied_channels.append((channel, human_count))
+                logger.debug(f"Found {human_count} users in {channel.name} ({guild.name})")
+        
+        if not occupied_channels:
+            logger.debug(f"No occupied voice channels found in {guild.name}")
+            return
+        
+        # 最も人数が多いチャンネルに参加
+        target_channel, user_count = max(occupied_channels, key=lambda x: x[1])
+        
+        logger.info(f"Auto-joining voice channel: #{target_channel.name} in {guild.name} ({user_count} users)")
+        
+        try:
+            # ボイスチャンネルに参加
+            voice_client = await target_channel.connect()
+            logger.info(f"Successfully joined {target_channel.name}")
+            
+            # VoiceManagerのCogがあれば挨拶音声を再生（Bot による参加挨拶）
+            voice_manager = self.get_cog('VoiceManager')
+            if voice_manager:
+                # Bot自身の挨拶として簡単な音声合成・再生を実行
+                try:
+                    await voice_manager._synthesize_and_play(guild.id, "参加しました", voice_client, is_greeting=True)
+                    logger.debug("Played bot join greeting")
+                except Exception as e:
+                    logger.error(f"Failed to play bot join greeting: {e}", exc_info=True)
+            
+        except discord.errors.ClientException as e:
+            logger.error(f"Failed to join voice channel {target_channel.name}: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error joining {target_channel.name}: {e}", exc_info=True)
+    
     async def on_error(self, event: str, *args, **kwargs):
         """エラーハンドリング"""
         logger.error(f"Discord event error in {event}: {args} {kwargs}", exc_info=True)
@@ -181,12 +255,32 @@ class YomiageBotClient(commands.Bot):
         """サーバー退出時のイベント"""
         logger.info(f"Left guild: {guild.name} (ID: {guild.id})")
         
-        # ボイスクライアント情報をクリーンアップ
-        if guild.id in self.voice_clients_dict:
-            del self.voice_clients_dict[guild.id]
+        # 読み上げ・再生ワーカーを停止してからギルドの状態をクリーンアップ
+        tts_handler = self.get_cog('TTSHandler')
+        if tts_handler:
+            tts_handler._stop_workers(guild.id)
+        voice_manager = self.get_cog('VoiceManager')
+        if voice_manager:
+            voice_manager._stop_play_worker(guild.id)
+        self._guild_state.pop(guild.id, None)
+    
+    async def on_voice_state_update(
+        self,
+        member: discord.Member,
+        before: discord.VoiceState,
+        after: discord.VoiceState
+    ):
+        """Bot自身のボイス状態変更時にボイスクライアントのマッピングを更新"""
+        if self.user is None or member.id != self.user.id:
+            return
+        
+        if after.channel is None:
+            self.set_voice_client_for_guild(member.guild.id, None)
+            return
         
-        if guild.id in self.tts_queue:
-            del self.tts_queue[guild.id]
+        voice_client = member.guild.voice_client
+        if voice_client is not None:
+            self.set_voice_client_for_guild(member.guild.id, voice_client)
     
     async def close(self):
         """Bot終了処理"""
@@ -202,40 +296,61 @@ class YomiageBotClient(commands.Bot):
         
         # 親クラスの終了処理
         await super().close()
+        
+        # TTS API クライアントを停止
+        try:
+            await self._exit_stack.aclose()
+        except Exception as e:
+            logger.error(f"Error closing TTS client: {e}")
+        
+        # 未反映のキャッシュアクセス情報を書き出す
+        try:
+            await self.cache_manager.close()
+        except Exception as e:
+            logger.error(f"Error closing cache manager: {e}")
+        
+        # 共有HTTPセッションを閉じる
+        if self.http_session and not self.http_session.closed:
+            await self.http_session.close()
+        
         logger.info("YomiageBot shutdown complete")
     
+    def _state(self, guild_id: int) -> GuildState:
+        """指定サーバーの状態を取得（存在しない場合は作成）"""
+        state = self._guild_state.get(guild_id)
+        if state is None:
+            state = self._guild_state[guild_id] = GuildState()
+        return state
+    
+    def get_guild_state(self, guild_id: int, create: bool = False) -> Optional[GuildState]:
+        """
+        指定サーバーの状態を取得
+        
+        Args:
+            guild_id: サーバーID
+            create: 存在しない場合に作成する場合 True
+            
+        Returns:
+            サーバーの状態。存在せず create=False の場合は None
+        """
+        if create:
+            return self._state(guild_id)
+        return self._guild_state.get(guild_id)
+    
     def get_voice_client_for_guild(self, guild_id: int) -> Optional[discord.VoiceClient]:
         """指定サーバーのボイスクライアントを取得"""
-        # discord.pyの標準機能を使用してボイスクライアントを検索
-        for voice_client in self.voice_clients:
-            if voice_client.guild.id == guild_id:
-                return voice_client
-        return None
+        # ボイス状態更新イベントで同期しているマッピングから O(1) で取得
+        state = self._guild_state.get(guild_id)
+        return state.vc if state is not None else None
     
     def set_voice_client_for_guild(self, guild_id: int, voice_client: Optional[discord.VoiceClient]):
         """指定サーバーのボイスクライアントを設定"""
         if voice_client is None:
-            self.voice_clients_dict.pop(guild_id, None)
+            state = self._guild_state.get(guild_id)
+            if state is not None:
+                state.vc = None
+                state.active = False
         else:
-            self.voice_clients_dict[guild_id] = voice_client
-    
-    async def play_audio_in_guild(self, guild_id: int, audio_source: discord.AudioSource):
-        """指定サーバーで音声を再生"""
-        voice_client = self.get_voice_client_for_guild(guild_id)
-        
-        if voice_client is None or not voice_client.is_connected():
-            logger.warning(f"No voice client connected for guild {guild_id}")
-            return False
-        
-        if voice_client.is_playing():
-            logger.debug(f"Voice client busy in guild {guild_id}, audio will be queued")
-            # TODO: キュー機能を実装
-            return False
-        
-        try:
-            voice_client.play(audio_source)
-            logger.debug(f"Started playing audio in guild {guild_id}")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to play audio in guild {guild_id}: {e}")
-            return False
\ No newline at end of file
+            state = self._state(guild_id)
+            state.vc = voice_client
+            state.active = True
@@ -5,15 +5,38 @@ import discord
 from discord.ext import commands
 import asyncio
 import io
-from typing import Optional
+import re
+from itertools import islice
+from typing import Optional, Dict, List, Tuple
 
 # ユーティリティのインポート
-from bot.utils.tts_api import TTSAPIClient, TTSAPIError
+from bot.utils.tts_api import TTSAPIError
 from bot.utils.text_processor import TextProcessor
-from bot.utils.cache_manager import CacheManager
+from bot.utils.audio_converter import decode_to_pcm, PCMBufferAudio
+from bot.utils.lru_cache import BytesLRUCache
+from bot.utils.guild_state import GuildState
 
 logger = logging.getLogger(__name__)
 
+# 再生待ちで先行合成しておく音声の最大数
+PREFETCH_SIZE = 2
+# 1件あたりの再生タイムアウト（秒）
+PLAYBACK_TIMEOUT = 30.0
+# 文単位で並行合成する際の分割数上限・同時合成数
+MAX_SENTENCE_CHUNKS = 4
+SYNTHESIS_CONCURRENCY = 3
+# この文字数以下のメッセージは分割しない
+SENTENCE_SPLIT_MIN_LENGTH = 40
+# 句読点が連続する場合（「!?」「!!!」など）は末尾で分割
+SENTENCE_SPLIT_PATTERN = re.compile(r'(?<=[。！？!?\n])(?![。！？!?\n])')
+# 同一ユーザーの連続メッセージをまとめる待機時間（秒）
+COALESCE_DELAY = 0.4
+# TTS API への接続維持リクエストの送信間隔（秒）
+KEEPALIVE_INTERVAL = 25.0
+# デコード済みPCMのメモリキャッシュ上限
+PCM_CACHE_MAX_ENTRIES = 128
+PCM_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
 
 class TTSHandler(commands.Cog):
     """TTS処理Cog"""
@@ -28,13 +51,31 @@ class TTSHandler(commands.Cog):
         self.bot = bot
         
         # TTS関連の初期化
-        self.tts_client = TTSAPIClient(api_url=self.bot.tts_api_url)
+        self.tts_client = self.bot.tts_client  # 全Cogで共有（Bot が開始・停止する）
         self.text_processor = TextProcessor()
-        self.cache_manager = CacheManager(cache_dir=str(self.bot.cache_dir))
+        self.cache_manager = self.bot.cache_manager  # 全Cogで共有
+        
+        # 頻出フレーズのデコード済みPCM（ディスクキャッシュ・デコードを省略）
+        self.pcm_cache = BytesLRUCache(
+            max_entries=PCM_CACHE_MAX_ENTRIES,
+            max_bytes=PCM_CACHE_MAX_BYTES
+        )
+        
+        # 読み上げキュー・ワーカーはギルドごとの状態（GuildState）で管理
+        self.synthesis_semaphore = asyncio.Semaphore(SYNTHESIS_CONCURRENCY)
         
-        # 音声再生キュー（ギルドごと）: asyncio.Queue使用
-        self.tts_queues = {}  # guild_id -> asyncio.Queue
-        self.processing_flags = {}  # ギルドごとの処理中フラグ
+        # TTS API への接続維持タスク（cog_load で開始）
+        self._keepalive_task: Optional[asyncio.Task] = None
+        
+        # コマンド応答用の Embed（毎回組み立て直さずに使い回す）
+        self._voice_settings_embed: Optional[discord.Embed] = None
+        self._voice_settings_embed_key: Optional[str] = None  # 作成時の設定ハッシュ
+        self._cache_stats_embed = self._build_cache_stats_embed()
+        
+        # 連続メッセージの結合待ち（ギルド・送信者ごと）
+        self._pending: Dict[Tuple[int, int], Tuple[str, List[str]]] = {}  # (guild_id, author_id) -> (表示名, テキスト)
+        self._flush_handles: Dict[Tuple[int, int], asyncio.TimerHandle] = {}
+        self._flush_tasks = set()  # 実行中の読み上げ追加（GC による中断を防ぐため参照を保持）
         
         logger.info("TTSHandler cog initialized")
     
@@ -42,25 +83,46 @@ class TTSHandler(commands.Cog):
         """Cog ロード時の処理"""
         logger.info("TTSHandler cog loaded")
         
-        # 期限切れキャッシュをクリーンアップ
-        try:
-            await self.cache_manager.cleanup_expired_cache()
-        except Exception as e:
-            logger.warning(f"Cache cleanup failed: {e}")
+        # アイドル中も TTS API との接続を維持（次回合成時の再接続を回避）
+        self._keepalive_task = asyncio.create_task(self._keepalive())
     
     async def cog_unload(self):
         """Cog アンロード時の処理"""
         logger.info("TTSHandler cog unloading...")
         
-        # TTS クライアントを閉じる
-        await self.tts_client.close()
-        
-        # キューをクリア
-        self.tts_queues.clear()
-        self.processing_flags.clear()
+        # 接続維持タスクを停止
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+            self._keepalive_task = None
+        
+        # 結合待ちのメッセージを破棄
+        for handle in self._flush_handles.values():
+            handle.cancel()
+        self._flush_handles.clear()
+        for task in self._flush_tasks:
+            task.cancel()
+        self._flush_tasks.clear()
+        self._pending.clear()
+        
+        # ワーカーを停止してキューをクリア
+        for guild in self.bot.guilds:
+            self._stop_workers(guild.id)
+        self.pcm_cache.clear()
         
         logger.info("TTSHandler cog unloaded")
     
+    async def _keepalive(self):
+        """TTS API に定期的に軽量リクエストを送信し、接続プールの接続を維持"""
+        while True:
+            await asyncio.sleep(KEEPALIVE_INTERVAL)
+            try:
+                await self.tts_client.ping()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # 想定外のエラーでも接続維持を止めない
+                logger.warning("TTS API keepalive failed: %s", e, exc_info=True)
+    
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
         """
@@ -69,22 +131,22 @@ class TTSHandler(commands.Cog):
         Args:
             message: 受信したメッセージ
         """
-        # デバッグ用：すべてのメッセージを記録
-        logger.info(f"[DEBUG] Message received: '{message.content[:50]}...' from {message.author.display_name} (bot={message.author.bot}) in guild={message.guild.name if message.guild else 'DM'}")
-        
-        # サーバーメッセージ以外は無視
-        if not message.guild:
-            logger.debug("Message ignored: Not in guild (DM)")
+        # DM・ボイスチャンネル未接続のサーバーは文字列処理やログ出力の前に除外
+        if message.guild is None:
+            return
+        state = self.bot.get_guild_state(message.guild.id)
+        if state is None or not state.active:
             return
-        logger.info(f"[DEBUG] Step 1: Guild check passed - {message.guild.name}")
+        
+        # デバッグ用：対象メッセージを記録
+        logger.debug("Message received: '%.50s...' from %s (bot=%s) in guild=%s",
+                     message.content, message.author.display_name, message.author.bot, message.guild.name)
         
         # Bot がボイスチャンネルに接続していない場合は無視
-        voice_client = self.bot.get_voice_client_for_guild(message.guild.id)
-        logger.info(f"[DEBUG] Step 2: Voice client check - voice_client={voice_client}, connected={voice_client.is_connected() if voice_client else 'None'}")
+        voice_client = state.vc
         if not voice_client or not voice_client.is_connected():
-            logger.info(f"Message ignored: Bot not connected to voice channel in {message.guild.name}")
+            logger.debug("Message ignored: Bot not connected to voice channel in %s", message.guild.name)
             return
-        logger.info(f"[DEBUG] Step 3: Voice connection check passed")
         
         # メッセージ内容の処理
         text_to_process = ""
@@ -92,7 +154,6 @@ class TTSHandler(commands.Cog):
         # テキストコンテンツがある場合
         if message.content and message.content.strip():
             text_to_process = message.content
-            logger.info(f"[DEBUG] Step 4: Text content found - '{message.content[:30]}...'")
         
         # ファイル添付がある場合
         if message.attachments:
@@ -100,30 +161,82 @@ class TTSHandler(commands.Cog):
                 text_to_process += " ファイル"
             else:
                 text_to_process = "ファイル"
-            logger.info(f"[DEBUG] Step 5: File attachment detected - {len(message.attachments)} files")
         
         # テキストもファイルもない場合は無視
         if not text_to_process:
-            logger.info("Message ignored: No content or attachments")
+            logger.debug("Message ignored: No content or attachments")
             return
         
-        logger.info(f"[DEBUG] Step 6: Final text to process - '{text_to_process[:50]}...'")
-        
         # WebHookメッセージ（Bot扱い）も処理対象に含める
-        logger.info(f"[TTS] Processing message: '{text_to_process[:50]}...' from {message.author.display_name}")
+        logger.debug("[TTS] Processing message: '%.50s...' from %s", text_to_process, message.author.display_name)
         
         # テキストを前処理
-        logger.info(f"[DEBUG] Step 7: Starting text processing")
         processed_text = self.text_processor.process_message_text(text_to_process)
         if not processed_text:
-            logger.info(f"Message text processing failed: {text_to_process[:50]}...")
+            logger.debug("Message text processing failed: %.50s...", text_to_process)
             return
-        logger.info(f"[DEBUG] Step 8: Text processing completed - '{processed_text[:30]}...'")
         
-        # TTS キューに追加
-        logger.info(f"[DEBUG] Step 9: Adding to TTS queue")
-        await self._queue_tts_message(message.guild.id, processed_text, message.author.display_name)
-        logger.info(f"[DEBUG] Step 10: TTS queue processing completed")
+        # 連続メッセージをまとめてから TTS キューに追加
+        await self._add_pending_message(message.guild.id, message.author.id, message.author.display_name, processed_text)
+    
+    async def _add_pending_message(self, guild_id: int, author_id: int, author_name: str, text: str):
+        """
+        メッセージを結合待ちに追加
+        
+        同一ユーザーが短時間に連続送信したメッセージを1回の読み上げにまとめ、
+        API呼び出し回数を削減する。
+        
+        Args:
+            guild_id: サーバーID
+            author_id: 送信者ID
+            author_name: 送信者の表示名
+            text: 前処理済みの読み上げテキスト
+        """
+        key = (guild_id, author_id)
+        
+        # 結合後の文字数が上限を超える場合は先に読み上げ
+        pending = self._pending.get(key)
+        if pending:
+            pending_length = sum(len(t) + 1 for t in pending[1])
+            if pending_length + len(text) > self.text_processor.max_length:
+                await self._flush_pending(key)
+        
+        if key in self._pending:
+            self._pending[key][1].append(text)
+        else:
+            self._pending[key] = (author_name, [text])
+        
+        # 待機タイマーを再設定
+        handle = self._flush_handles.pop(key, None)
+        if handle:
+            handle.cancel()
+        
+        loop = asyncio.get_running_loop()
+        self._flush_handles[key] = loop.call_later(COALESCE_DELAY, self._schedule_flush, key)
+    
+    def _schedule_flush(self, key: Tuple[int, int]):
+        """結合待ちのメッセージの TTS キューへの追加をバックグラウンドで実行"""
+        task = asyncio.create_task(self._flush_pending(key))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+    
+    async def _flush_pending(self, key: Tuple[int, int]):
+        """
+        結合待ちのメッセージを TTS キューに追加
+        
+        Args:
+            key: (サーバーID, 送信者ID)
+        """
+        handle = self._flush_handles.pop(key, None)
+        if handle:
+            handle.cancel()
+        
+        pending = self._pending.pop(key, None)
+        if not pending:
+            return
+        
+        author_name, texts = pending
+        await self._queue_tts_message(key[0], "、".join(texts), author_name)
     
     async def _queue_tts_message(self, guild_id: int, text: str, author_name: str):
         """
@@ -134,9 +247,12 @@ class TTSHandler(commands.Cog):
             text: 読み上げテキスト
             author_name: 送信者の表示名
         """
-        # キューの初期化（asyncio.Queue使用で効率化）
-        if guild_id not in self.tts_queues:
-            self.tts_queues[guild_id] = asyncio.Queue()
+        # ギルドの状態を取得（deque で先頭取り出しを O(1) に）
+        state = self.bot.get_guild_state(guild_id, create=True)
+        queue = state.queue
+        
+        # 合成・再生ワーカーを開始（未起動の場合）
+        self._ensure_workers(guild_id, state)
         
         # メッセージをキューに追加
         queue_item = {
@@ -145,134 +261,282 @@ class TTSHandler(commands.Cog):
             "timestamp": discord.utils.utcnow()
         }
         
-        await self.tts_queues[guild_id].put(queue_item)
-        logger.info(f"[DEBUG] Queued TTS message: {text[:30]}... (queue size: {self.tts_queues[guild_id].qsize()})")
+        # キューが満杯の場合は最も古いメッセージを破棄
+        if len(queue) == queue.maxlen:
+            logger.warning("TTS queue full in guild %s, dropping oldest message", guild_id)
+        queue.append(queue_item)
+        state.event.set()
+        logger.debug("Queued TTS message: %.30s... (queue size: %d)", text, len(queue))
+    
+    def _ensure_workers(self, guild_id: int, state: GuildState):
+        """
+        ギルドの合成ワーカー・再生ワーカーを起動
+        
+        合成ワーカーが次のメッセージを先行合成している間に再生ワーカーが
+        現在の音声を再生するため、API通信と再生が重なって処理される。
+        
+        Args:
+            guild_id: サーバーID
+            state: ギルドの状態
+        """
+        if state.tasks and all(not task.done() for task in state.tasks):
+            return
+        
+        # 一方のワーカーのみ終了している場合は残りも停止してから起動し直す
+        for task in state.tasks:
+            task.cancel()
         
-        # キュー処理を開始（既に処理中でない場合）
-        if guild_id not in self.processing_flags or not self.processing_flags[guild_id]:
-            asyncio.create_task(self._process_tts_queue(guild_id))
+        # 合成済み音声のキュー（先行合成数を制限）
+        play_queue = asyncio.Queue(maxsize=PREFETCH_SIZE)
+        state.play_queue = play_queue
+        
+        state.tasks = (
+            asyncio.create_task(self._synthesis_worker(guild_id, state, play_queue)),
+            asyncio.create_task(self._playback_worker(guild_id, state, play_queue)),
+        )
+        logger.debug("Started TTS workers for guild %s", guild_id)
     
-    async def _process_tts_queue(self, guild_id: int):
+    def _stop_workers(self, guild_id: int):
         """
-        TTSキューを処理
+        ギルドのワーカーを停止し、未処理のキューを破棄
         
         Args:
             guild_id: サーバーID
         """
-        # 処理中フラグを設定
-        self.processing_flags[guild_id] = True
-        logger.info(f"[DEBUG] Starting TTS queue processing for guild {guild_id}")
+        state = self.bot.get_guild_state(guild_id)
+        if state is None:
+            return
+        
+        state.queue.clear()
+        if not state.tasks:
+            return
+        
+        current_task = asyncio.current_task()
+        for task in state.tasks:
+            if task is not current_task:
+                task.cancel()
+        
+        state.tasks = ()
+        state.play_queue = None
+        logger.info(f"Stopped TTS workers for guild {guild_id}")
+    
+    async def _synthesis_worker(self, guild_id: int, state: GuildState, play_queue: asyncio.Queue):
+        """
+        TTSキューからメッセージを取り出して音声合成し、再生キューに渡す
+        
+        Args:
+            guild_id: サーバーID
+            state: ギルドの状態
+            play_queue: 合成済み音声の再生キュー
+        """
+        queue = state.queue
+        queue_event = state.event
         
         try:
-            while guild_id in self.tts_queues:
-                try:
-                    # キューから次のアイテムを取得（1秒タイムアウト）
-                    queue_item = await asyncio.wait_for(
-                        self.tts_queues[guild_id].get(), timeout=1.0
-                    )
-                    logger.info(f"[DEBUG] Processing queue item: {queue_item['text'][:30]}...")
-                    
-                    # ボイスクライアントの状態確認
-                    voice_client = self.bot.get_voice_client_for_guild(guild_id)
-                    if not voice_client or not voice_client.is_connected():
-                        logger.info(f"Voice client disconnected, ending TTS queue processing for guild {guild_id}")
-                        # キューをクリア
-                        while not self.tts_queues[guild_id].empty():
-                            try:
-                                self.tts_queues[guild_id].get_nowait()
-                            except asyncio.QueueEmpty:
-                                break
-                        break
-                except asyncio.TimeoutError:
-                    # キューが空の場合、処理終了
-                    logger.debug(f"TTS queue timeout for guild {guild_id}, ending processing")
-                    break
+            while True:
+                # キューが空の場合は追加通知まで待機
+                if not queue:
+                    queue_event.clear()
+                    await queue_event.wait()
+                    continue
                 
-                # 音声合成・再生
-                logger.info(f"[DEBUG] Starting synthesize and play for: {queue_item['text'][:30]}...")
-                await self._synthesize_and_play_message(guild_id, queue_item)
-                logger.info(f"[DEBUG] Completed synthesize and play for: {queue_item['text'][:30]}...")
+                queue_item = queue.popleft()
+                logger.debug("Processing queue item: %.30s...", queue_item["text"])
                 
-                # 再生完了まで待機
-                await self._wait_for_playback_completion(voice_client)
+                # ボイスクライアントの状態確認
+                voice_client = state.vc
+                if not voice_client or not voice_client.is_connected():
+                    logger.info(f"Voice client disconnected, ending TTS queue processing for guild {guild_id}")
+                    self._stop_workers(guild_id)
+                    return
                 
-                # 次のメッセージとの間隔
-                await asyncio.sleep(0.5)
-        
+                # 文単位に分割して並行合成し、先頭から順に再生キューへ渡す
+                # （先頭の文の再生中に後続の文を合成）
+                settings_key = self.tts_client.default_settings_key
+                # 同じメッセージの後続の文がある場合は再生後の間隔を空けない（has_next）
+                chunks = self._split_sentences(queue_item["text"])
+                last_index = len(chunks) - 1
+                tasks = [
+                    asyncio.create_task(self._prepare_audio(
+                        {**queue_item, "text": chunk, "has_next": index < last_index}, settings_key
+                    ))
+                    for index, chunk in enumerate(chunks)
+                ]
+                try:
+                    for task in tasks:
+                        prepared = await task
+                        if prepared is not None:
+                            # 再生キューが満杯の場合は再生完了まで待機
+                            await play_queue.put(prepared)
+                finally:
+                    for task in tasks:
+                        task.cancel()
+        
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
-            logger.error(f"Error processing TTS queue for guild {guild_id}: {e}")
+            logger.error(f"Error in TTS synthesis worker for guild {guild_id}: {e}")
+            self._stop_workers(guild_id)
+    
+    def _split_sentences(self, text: str) -> List[str]:
+        """
+        読み上げテキストを文単位に分割
         
-        finally:
-            # 処理中フラグをクリア
-            self.processing_flags[guild_id] = False
+        Args:
+            text: 読み上げテキスト
+            
+        Returns:
+            分割後のテキストのリスト（最大 MAX_SENTENCE_CHUNKS 件）
+        """
+        if len(text) <= SENTENCE_SPLIT_MIN_LENGTH:
+            return [text]
+        
+        chunks = []
+        for chunk in SENTENCE_SPLIT_PATTERN.split(text):
+            chunk = chunk.strip()
+            if not chunk:
+                continue
+            # 文字を含まない断片（記号のみ）は単独で合成せず直前の文に含める
+            if chunks and not any(c.isalnum() for c in chunk):
+                chunks[-1] += chunk
+            else:
+                chunks.append(chunk)
+        if not chunks:
+            return [text]
+        
+        # 分割数が多すぎる場合は末尾をまとめる
+        if len(chunks) > MAX_SENTENCE_CHUNKS:
+            chunks = chunks[:MAX_SENTENCE_CHUNKS - 1] + ["".join(chunks[MAX_SENTENCE_CHUNKS - 1:])]
+        return chunks
     
-    async def _synthesize_and_play_message(self, guild_id: int, queue_item: dict):
+    async def _prepare_audio(self, queue_item: dict, settings_key: str) -> Optional[Tuple[dict, Optional[bytes], Optional[bytes]]]:
         """
-        メッセージを音声合成して再生
+        キューアイテムの音声を再生可能な形式で用意
         
         Args:
-            guild_id: サーバーID
             queue_item: キューアイテム
+            settings_key: 事前計算済みのTTS設定ハッシュ
+            
+        Returns:
+            (キューアイテム, 音声データ, PCMデータ)。合成に失敗した場合は None
         """
-        text = queue_item["text"]
-        author = queue_item["author"]
+        pcm_key = (settings_key, queue_item["text"])
         
-        voice_client = self.bot.get_voice_client_for_guild(guild_id)
-        if not voice_client:
-            return
+        # メモリキャッシュにあればそのまま再生
+        pcm_data = self.pcm_cache.get(pcm_key)
+        if pcm_data is not None:
+            logger.debug("Using in-memory PCM for: %.20s...", queue_item["text"])
+            return queue_item, None, pcm_data
         
+        # TTSサーバーへの同時リクエスト数を制限
+        async with self.synthesis_semaphore:
+            audio_data = await self._synthesize_message(queue_item, settings_key)
+        if audio_data is None:
+            return None
+        
+        # PCM にデコード（失敗時は FFmpeg で再生）
         try:
-            # キャッシュをチェック
-            logger.info(f"[DEBUG] Checking cache for: {text[:20]}... (by {author})")
-            tts_settings = self.tts_client.default_settings.copy()
-            cached_audio = await self.cache_manager.get_cached_audio(text, tts_settings)
-            
-            if cached_audio:
-                logger.info(f"[DEBUG] Using cached audio for: {text[:20]}... (by {author})")
-                audio_data = cached_audio
-            else:
-                # TTS API で音声合成
-                logger.info(f"[DEBUG] Synthesizing audio via API for: {text[:20]}... (by {author})")
-                audio_data = await self.tts_client.synthesize_speech(text)
-                logger.info(f"[DEBUG] Audio synthesis completed: {len(audio_data)} bytes")
+            pcm_data = await asyncio.to_thread(decode_to_pcm, audio_data)
+            self.pcm_cache.put(pcm_key, pcm_data)
+        except ValueError as e:
+            logger.warning(f"PCM decode failed, falling back to FFmpeg: {e}")
+            pcm_data = None
+        
+        return queue_item, audio_data, pcm_data
+    
+    async def _playback_worker(self, guild_id: int, state: GuildState, play_queue: asyncio.Queue):
+        """
+        合成済み音声を順番に再生
+        
+        Args:
+            guild_id: サーバーID
+            state: ギルドの状態
+            play_queue: 合成済み音声の再生キュー
+        """
+        loop = asyncio.get_running_loop()
+        
+        try:
+            while True:
+                queue_item, audio_data, pcm_data = await play_queue.get()
+                text = queue_item["text"]
+                author = queue_item["author"]
                 
-                # キャッシュに保存
-                await self.cache_manager.save_audio_cache(text, tts_settings, audio_data)
-                logger.info(f"[DEBUG] Audio saved to cache for: {text[:20]}...")
-            
-            # 音声ファイルから AudioSource を作成
-            logger.info(f"[DEBUG] Creating FFmpegPCMAudio source...")
-            audio_io = io.BytesIO(audio_data)
-            audio_source = discord.FFmpegPCMAudio(audio_io, pipe=True)
-            
-            # 音声再生
-            logger.info(f"[DEBUG] Starting voice playback for: {text[:30]}... (by {author})")
-            voice_client.play(audio_source)
-            logger.info(f"[DEBUG] Voice playback started successfully: {text[:30]}... (by {author})")
-            
-        except TTSAPIError as e:
-            logger.error(f"TTS API error for message by {author}: {e}")
+                voice_client = self.bot.get_voice_client_for_guild(guild_id)
+                if not voice_client or not voice_client.is_connected():
+                    logger.info(f"Voice client disconnected, ending TTS queue processing for guild {guild_id}")
+                    self._stop_workers(guild_id)
+                    return
+                
+                # 再生完了を after コールバックで通知（ポーリング不要）
+                done = asyncio.Event()
+                
+                def _after(error: Optional[Exception]):
+                    if error:
+                        logger.error(f"TTS playback error in guild {guild_id}: {error}")
+                    loop.call_soon_threadsafe(done.set)
+                
+                # 挨拶など他の再生が終わるまで待機してから再生
+                async with state.play_lock:
+                    try:
+                        # デコード済みの PCM は FFmpeg を介さずに再生
+                        if pcm_data is not None:
+                            audio_source = PCMBufferAudio(pcm_data)
+                        else:
+                            audio_source = discord.FFmpegPCMAudio(io.BytesIO(audio_data), pipe=True)
+                        
+                        voice_client.play(audio_source, after=_after)
+                        logger.debug("Voice playback started: %.30s... (by %s)", text, author)
+                    except Exception as e:
+                        logger.error(f"Failed to play message by {author}: {e}")
+                        continue
+                    
+                    # 再生完了まで待機
+                    try:
+                        await asyncio.wait_for(done.wait(), timeout=PLAYBACK_TIMEOUT)
+                    except asyncio.TimeoutError:
+                        logger.warning("TTS playback timeout, stopping...")
+                        voice_client.stop()
+                
+                # 次のメッセージとの間隔（同じメッセージの文の間は空けない）
+                if not queue_item.get("has_next"):
+                    await asyncio.sleep(0.5)
+        
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
-            logger.error(f"Failed to synthesize and play message by {author}: {e}")
+            logger.error(f"Error in TTS playback worker for guild {guild_id}: {e}")
+            self._stop_workers(guild_id)
     
-    async def _wait_for_playback_completion(self, voice_client: discord.VoiceClient, timeout: float = 30.0):
+    async def _synthesize_message(self, queue_item: dict, settings_key: str) -> Optional[bytes]:
         """
-        音声再生完了まで待機
+        メッセージを音声合成（キャッシュ優先）
         
         Args:
-            voice_client: ボイスクライアント
-            timeout: タイムアウト時間（秒）
+            queue_item: キューアイテム
+            settings_key: 事前計算済みのTTS設定ハッシュ
+            
+        Returns:
+            音声データ。合成に失敗した場合は None
         """
-        start_time = asyncio.get_event_loop().time()
+        text = queue_item["text"]
+        author = queue_item["author"]
         
-        while voice_client.is_playing():
-            await asyncio.sleep(0.05)  # より細かいチェック間隔でレスポンシブ性向上
+        async def _synthesize() -> bytes:
+            # TTS API で音声合成
+            logger.debug("Synthesizing audio via API for: %.20s... (by %s)", text, author)
+            audio_data = await self.tts_client.synthesize_speech(text)
+            logger.debug("Audio synthesis completed: %d bytes", len(audio_data))
+            return audio_data
+        
+        try:
+            # キャッシュを優先し、ない場合は合成して保存（同じテキストの合成は1回にまとめる）
+            return await self.cache_manager.get_or_synthesize(text, settings_key, _synthesize)
             
-            # タイムアウトチェック
-            if asyncio.get_event_loop().time() - start_time > timeout:
-                logger.warning("TTS playback timeout, stopping...")
-                voice_client.stop()
-                break
+        except TTSAPIError as e:
+            logger.error(f"TTS API error for message by {author}: {e}")
+        except Exception as e:
+            logger.error(f"Failed to synthesize message by {author}: {e}")
+        return None
     
     @commands.command(name="skip")
     async def skip_current_tts(self, ctx: commands.Context):
@@ -295,31 +559,20 @@ class TTSHandler(commands.Cog):
         """現在のTTSキューを表示"""
         guild_id = ctx.guild.id
         
-        if guild_id not in self.tts_queues or self.tts_queues[guild_id].empty():
+        state = self.bot.get_guild_state(guild_id)
+        queue = state.queue if state is not None else None
+        if not queue:
             await ctx.send("読み上げキューは空です。")
             return
         
-        queue_size = self.tts_queues[guild_id].qsize()
+        queue_size = len(queue)
         
-        # キューの内容を一時的に退避して表示（非破壊的読み取り）
-        temp_items = []
-        try:
-            while not self.tts_queues[guild_id].empty():
-                item = self.tts_queues[guild_id].get_nowait()
-                temp_items.append(item)
-        except asyncio.QueueEmpty:
-            pass
-        
-        # 表示用リスト作成
+        # 表示用リスト作成（先頭から参照するだけでキューは変更しない）
         queue_preview = []
-        for i, item in enumerate(temp_items[:5]):  # 最大5件表示
+        for i, item in enumerate(islice(queue, 5)):  # 最大5件表示
             text_preview = item["text"][:30] + "..." if len(item["text"]) > 30 else item["text"]
             queue_preview.append(f"{i+1}. {item['author']}: {text_preview}")
         
-        # キューに戻す
-        for item in temp_items:
-            await self.tts_queues[guild_id].put(item)
-        
         preview_text = "\n".join(queue_preview)
         
         if queue_size > 5:
@@ -338,15 +591,12 @@ class TTSHandler(commands.Cog):
         """TTSキューをクリア"""
         guild_id = ctx.guild.id
         
-        if guild_id in self.tts_queues:
-            queue_size = self.tts_queues[guild_id].qsize()
+        state = self.bot.get_guild_state(guild_id)
+        if state is not None and state.queue:
+            queue_size = len(state.queue)
             
             # キューを空にする
-            while not self.tts_queues[guild_id].empty():
-                try:
-                    self.tts_queues[guild_id].get_nowait()
-                except asyncio.QueueEmpty:
-                    break
+            state.queue.clear()
             
             await ctx.send(f"読み上げキューをクリアしました ({queue_size} 件削除)")
             logger.info(f"TTS queue cleared in {ctx.guild.name} ({queue_size} items)")
@@ -356,20 +606,40 @@ class TTSHandler(commands.Cog):
     @commands.command(name="voice")
     async def change_voice_settings(self, ctx: commands.Context, model_id: Optional[int] = None):
         """音声設定を変更（将来的な機能拡張用）"""
-        # 現在はデフォルト設定のみ対応
-        current_settings = self.tts_client.default_settings
+        # 現在はデフォルト設定のみ対応（設定が変わった場合のみ Embed を作り直す）
+        settings_key = self.tts_client.default_settings_key
+        if self._voice_settings_embed is None or self._voice_settings_embed_key != settings_key:
+            current_settings = self.tts_client.default_settings
+            
+            embed = discord.Embed(
+                title="現在の音声設定",
+                color=0x0099ff
+            )
+            
+            embed.add_field(name="Model ID", value=current_settings["model_id"], inline=True)
+            embed.add_field(name="Speaker ID", value=current_settings["speaker_id"], inline=True)
+            embed.add_field(name="Style", value=current_settings["style"], inline=True)
+            embed.add_field(name="Speed", value=current_settings["length"], inline=True)
+            
+            self._voice_settings_embed = embed
+            self._voice_settings_embed_key = settings_key
         
+        await ctx.send(embed=self._voice_settings_embed)
+    
+    @staticmethod
+    def _build_cache_stats_embed() -> discord.Embed:
+        """キャッシュ統計表示用の Embed の雛形を作成（値は表示時に更新）"""
         embed = discord.Embed(
-            title="現在の音声設定",
-            color=0x0099ff
+            title="音声キャッシュ統計",
+            color=0xff9900
         )
         
-        embed.add_field(name="Model ID", value=current_settings["model_id"], inline=True)
-        embed.add_field(name="Speaker ID", value=current_settings["speaker_id"], inline=True)
-        embed.add_field(name="Style", value=current_settings["style"], inline=True)
-        embed.add_field(name="Speed", value=current_settings["length"], inline=True)
-        
-        await ctx.send(embed=embed)
+        embed.add_field(name="ファイル数", value="-", inline=True)
+        embed.add_field(name="使用容量", value="-", inline=True)
+        embed.add_field(name="最大容量", value="-", inline=True)
+        embed.add_field(name="有効期限", value="-", inline=True)
+        embed.add_field(name="使用率", value="-", inline=True)
+        return embed
     
     @commands.command(name="cache")
     async def show_cache_stats(self, ctx: commands.Context):
@@ -377,18 +647,15 @@ class TTSHandler(commands.Cog):
         try:
             stats = self.cache_manager.get_cache_stats()
             
-            embed = discord.Embed(
-                title="音声キャッシュ統計",
-                color=0xff9900
-            )
-            
-            embed.add_field(name="ファイル数", value=f"{stats['file_count']} 件", inline=True)
-            embed.add_field(name="使用容量", value=f"{stats['total_size_mb']} MB", inline=True)
-            embed.add_field(name="最大容量", value=f"{stats['max_size_mb']} MB", inline=True)
-            embed.add_field(name="有効期限", value=f"{stats['expiry_hours']} 時間", inline=True)
+            # 雛形の Embed のフィールド値のみ更新
+            embed = self._cache_stats_embed
+            embed.set_field_at(0, name="ファイル数", value=f"{stats['file_count']} 件", inline=True)
+            embed.set_field_at(1, name="使用容量", value=f"{stats['total_size_mb']} MB", inline=True)
+            embed.set_field_at(2, name="最大容量", value=f"{stats['max_size_mb']} MB", inline=True)
+            embed.set_field_at(3, name="有効期限", value=f"{stats['expiry_hours']} 時間", inline=True)
             
             usage_percent = (stats['total_size_mb'] / stats['max_size_mb']) * 100
-            embed.add_field(name="使用率", value=f"{usage_percent:.1f}%", inline=True)
+            embed.set_field_at(4, name="使用率", value=f"{usage_percent:.1f}%", inline=True)
             
             await ctx.send(embed=embed)
             
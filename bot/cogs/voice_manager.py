@@ -3,17 +3,24 @@
 import logging
 import discord
 from discord.ext import commands
-from typing import Optional
+from typing import Optional, Dict
 import asyncio
 import io
 
 # ユーティリティのインポート
-from bot.utils.tts_api import TTSAPIClient
 from bot.utils.text_processor import TextProcessor
-from bot.utils.cache_manager import CacheManager
+from bot.utils.audio_converter import PCMFileAudio
 
 logger = logging.getLogger(__name__)
 
+# 1件あたりの再生タイムアウト（秒）
+PLAYBACK_TIMEOUT = 30.0
+# 挨拶音声の事前合成の同時実行数
+PREWARM_CONCURRENCY = 4
+# 挨拶テキスト（表示名に続ける定型部分）
+JOIN_GREETING_SUFFIX = "さん、こんちゃ！"
+LEAVE_GREETING_SUFFIX = "さん、またね！"
+
 
 class VoiceManager(commands.Cog):
     """ボイスチャンネル管理Cog"""
@@ -28,9 +35,17 @@ class VoiceManager(commands.Cog):
         self.bot = bot
         
         # TTS関連の初期化
-        self.tts_client = TTSAPIClient(api_url=self.bot.tts_api_url)
+        self.tts_client = self.bot.tts_client  # 全Cogで共有（Bot が開始・停止する）
         self.text_processor = TextProcessor()
-        self.cache_manager = CacheManager(cache_dir=str(self.bot.cache_dir))
+        self.cache_manager = self.bot.cache_manager  # 全Cogで共有
+        
+        # 挨拶などの再生キュー・再生ワーカー（ギルドごと）
+        self._play_queues: Dict[int, asyncio.Queue] = {}  # guild_id -> (音声ソース, 再生完了 Future)
+        self._play_workers: Dict[int, asyncio.Task] = {}
+        
+        # 挨拶音声の事前合成（キャッシュのウォームアップ）
+        self._prewarm_semaphore = asyncio.Semaphore(PREWARM_CONCURRENCY)
+        self._prewarm_tasks = set()  # 実行中のタスク（GC による中断を防ぐため参照を保持）
         
         logger.info("VoiceManager cog initialized")
     
@@ -51,11 +66,81 @@ class VoiceManager(commands.Cog):
         """Cog アンロード時の処理"""
         logger.info("VoiceManager cog unloading...")
         
-        # TTS クライアントを閉じる
-        await self.tts_client.close()
+        # 再生ワーカー・事前合成タスクを停止
+        for task in self._play_workers.values():
+            task.cancel()
+        self._play_workers.clear()
+        self._play_queues.clear()
+        for task in self._prewarm_tasks:
+            task.cancel()
+        self._prewarm_tasks.clear()
         
         logger.info("VoiceManager cog unloaded")
     
+    def _stop_play_worker(self, guild_id: int):
+        """
+        ギルドの再生ワーカーを停止し、再生キューを破棄
+        
+        Args:
+            guild_id: サーバーID
+        """
+        task = self._play_workers.pop(guild_id, None)
+        if task is not None:
+            task.cancel()
+        self._play_queues.pop(guild_id, None)
+    
+    @commands.Cog.listener()
+    async def on_ready(self):
+        """
+        Bot準備完了時にボイスチャンネル内のメンバーの挨拶音声を事前合成
+        
+        cog_load 時点ではサーバー情報が未取得のため、準備完了後に実行する。
+        """
+        members = [
+            member
+            for guild in self.bot.guilds
+            for channel in guild.voice_channels
+            for member in channel.members
+            if not member.bot
+        ]
+        if not members:
+            return
+        
+        logger.info(f"Pre-warming greeting cache for {len(members)} members")
+        await asyncio.gather(
+            *(self._prewarm_greeting(self._greeting_text(member, is_join))
+              for member in members
+              for is_join in (True, False)),
+            return_exceptions=True
+        )
+        logger.info("Greeting cache pre-warm completed")
+    
+    async def _prewarm_greeting(self, text: str):
+        """
+        挨拶音声がキャッシュにない場合は合成してキャッシュに保存
+        
+        Args:
+            text: 挨拶テキスト
+        """
+        async with self._prewarm_semaphore:
+            settings_key = self.tts_client.default_settings_key
+            if await self.cache_manager.cache_exists(text, settings_key):
+                return
+            
+            try:
+                await self.cache_manager.get_or_synthesize(
+                    text, settings_key, lambda: self.tts_client.synthesize_speech(text), store_pcm=True
+                )
+                logger.debug(f"Pre-warmed greeting: {text}")
+            except Exception as e:
+                logger.debug(f"Failed to pre-warm greeting {text}: {e}")
+    
+    def _schedule_prewarm(self, text: str):
+        """挨拶音声の事前合成をバックグラウンドで実行"""
+        task = asyncio.create_task(self._prewarm_greeting(text))
+        self._prewarm_tasks.add(task)
+        task.add_done_callback(self._prewarm_tasks.discard)
+    
     @commands.Cog.listener()
     async def on_voice_state_update(
         self, 
@@ -75,37 +160,49 @@ class VoiceManager(commands.Cog):
         if member.bot:
             return
         
+        # ボイスクライアントはイベントごとに1回だけ取得し、各処理に引き渡す
+        voice_client = self.bot.get_voice_client_for_guild(member.guild.id)
+        
         # ユーザーがボイスチャンネルに参加した場合
         if before.channel is None and after.channel is not None:
-            await self._handle_user_join(member, after.channel)
+            await self._handle_user_join(member, after.channel, voice_client)
+            
+            # 退出時の挨拶を先に合成しておく
+            self._schedule_prewarm(self._greeting_text(member, is_join=False))
         
         # ユーザーがボイスチャンネルから退出した場合
         elif before.channel is not None and after.channel is None:
-            await self._handle_user_leave(member, before.channel)
+            await self._handle_user_leave(member, before.channel, voice_client)
         
         # ユーザーがボイスチャンネル間を移動した場合
         elif before.channel is not None and after.channel is not None and before.channel != after.channel:
-            await self._handle_user_move(member, before.channel, after.channel)
+            await self._handle_user_move(member, before.channel, after.channel, voice_client)
     
-    async def _handle_user_join(self, member: discord.Member, channel: discord.VoiceChannel):
+    async def _handle_user_join(
+        self,
+        member: discord.Member,
+        channel: discord.VoiceChannel,
+        voice_client: Optional[discord.VoiceClient] = None
+    ):
         """
         ユーザーのボイスチャンネル参加処理
         
         Args:
             member: 参加したメンバー
             channel: 参加先チャンネル
+            voice_client: このサーバーのボイスクライアント（未接続の場合は None）
         """
         logger.debug(f"User joined voice channel: {member.display_name} -> #{channel.name}")
         
         # Bot がこのサーバーのどのボイスチャンネルにも接続していない場合のみ参加
-        if not any(vc.guild.id == member.guild.id for vc in self.bot.voice_clients):
+        if voice_client is None:
             try:
                 voice_client = await channel.connect()
                 self.bot.set_voice_client_for_guild(member.guild.id, voice_client)
                 logger.info(f"Bot joined voice channel: #{channel.name} in {member.guild.name}")
                 
                 # 参加挨拶を再生
-                await self._play_greeting(member, is_join=True)
+                await self._play_greeting(member, voice_client, is_join=True)
                 
             except discord.errors.ClientException as e:
                 logger.error(f"Failed to connect to voice channel: {e}")
@@ -115,36 +212,36 @@ class VoiceManager(commands.Cog):
             logger.debug(f"Bot already connected to voice in {member.guild.name}")
             
             # 既に接続中でも挨拶は再生
-            await self._play_greeting(member, is_join=True)
+            await self._play_greeting(member, voice_client, is_join=True)
     
-    async def _handle_user_leave(self, member: discord.Member, channel: discord.VoiceChannel):
+    async def _handle_user_leave(
+        self,
+        member: discord.Member,
+        channel: discord.VoiceChannel,
+        voice_client: Optional[discord.VoiceClient] = None
+    ):
         """
         ユーザーのボイスチャンネル退出処理
         
         Args:
             member: 退出したメンバー
             channel: 退出元チャンネル
+            voice_client: このサーバーのボイスクライアント（未接続の場合は None）
         """
         logger.debug(f"User left voice channel: {member.display_name} <- #{channel.name}")
         
-        # 退出挨拶を再生
-        await self._play_greeting(member, is_join=False)
-        
-        # 挨拶の再生完了を待機してからチャンネルをチェック
-        voice_client = self.bot.get_voice_client_for_guild(member.guild.id)
-        if voice_client and voice_client.is_playing():
-            # 音声再生が完了するまで待機
-            while voice_client.is_playing():
-                await asyncio.sleep(0.1)
+        # 退出挨拶を再生し、再生完了を待機してからチャンネルをチェック
+        await self._play_greeting(member, voice_client, is_join=False, wait=True)
         
         # チャンネルに人がいなくなったかチェック
-        await self._check_and_leave_if_empty(channel)
+        await self._check_and_leave_if_empty(channel, voice_client)
     
     async def _handle_user_move(
         self, 
         member: discord.Member, 
         from_channel: discord.VoiceChannel, 
-        to_channel: discord.VoiceChannel
+        to_channel: discord.VoiceChannel,
+        voice_client: Optional[discord.VoiceClient] = None
     ):
         """
         ユーザーのボイスチャンネル移動処理
@@ -153,114 +250,223 @@ class VoiceManager(commands.Cog):
             member: 移動したメンバー
             from_channel: 移動元チャンネル
             to_channel: 移動先チャンネル
+            voice_client: このサーバーのボイスクライアント（未接続の場合は None）
         """
         logger.debug(f"User moved voice channel: {member.display_name} #{from_channel.name} -> #{to_channel.name}")
         
-        # 移動元チャンネルが空になったかチェック
-        await self._check_and_leave_if_empty(from_channel)
+        # 移動元チャンネルが空になったかチェック（退出した場合は未接続として参加処理を行う）
+        if await self._check_and_leave_if_empty(from_channel, voice_client):
+            voice_client = None
         
         # 移動先チャンネルでの参加処理（移動も参加として扱う）
-        await self._handle_user_join(member, to_channel)
+        await self._handle_user_join(member, to_channel, voice_client)
     
-    async def _check_and_leave_if_empty(self, channel: discord.VoiceChannel):
+    async def _check_and_leave_if_empty(
+        self,
+        channel: discord.VoiceChannel,
+        voice_client: Optional[discord.VoiceClient] = None
+    ) -> bool:
         """
         チャンネルが空の場合、Botを退出させる
         
         Args:
             channel: チェック対象のチャンネル
+            voice_client: このサーバーのボイスクライアント（未接続の場合は None）
+            
+        Returns:
+            Bot が退出した場合 True
         """
+        # Bot がこのチャンネルに接続しているかチェック
+        if not voice_client or voice_client.channel.id != channel.id:
+            return False
+        
         # Bot以外のメンバーがいるかチェック
-        human_members = [m for m in channel.members if not m.bot]
+        if any(not m.bot for m in channel.members):
+            return False
         
-        if not human_members:
-            # Bot がこのチャンネルに接続しているかチェック
-            voice_client = self.bot.get_voice_client_for_guild(channel.guild.id)
-            
-            if voice_client and voice_client.channel.id == channel.id:
-                try:
-                    await voice_client.disconnect()
-                    self.bot.set_voice_client_for_guild(channel.guild.id, None)
-                    logger.info(f"Bot left empty voice channel: #{channel.name} in {channel.guild.name}")
-                except Exception as e:
-                    logger.error(f"Failed to disconnect from voice channel: {e}")
+        try:
+            await voice_client.disconnect()
+            self.bot.set_voice_client_for_guild(channel.guild.id, None)
+            logger.info(f"Bot left empty voice channel: #{channel.name} in {channel.guild.name}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to disconnect from voice channel: {e}")
+            return False
     
-    async def _play_greeting(self, member: discord.Member, is_join: bool):
+    async def _play_greeting(
+        self,
+        member: discord.Member,
+        voice_client: Optional[discord.VoiceClient],
+        is_join: bool,
+        wait: bool = False
+    ):
         """
         挨拶音声を再生
         
         Args:
             member: 対象メンバー
+            voice_client: このサーバーのボイスクライアント
             is_join: 参加時の場合 True、退出時の場合 False
+            wait: 再生完了まで待機する場合 True
         """
         # Bot がボイスチャンネルに接続していない場合はスキップ
-        voice_client = self.bot.get_voice_client_for_guild(member.guild.id)
         if not voice_client or not voice_client.is_connected():
             logger.debug(f"No voice client for greeting: {member.display_name}")
             return
         
         # 挨拶メッセージ生成
-        if is_join:
-            greeting_text = f"{member.display_name}さん、こんちゃ！"
-        else:
-            greeting_text = f"{member.display_name}さん、またね！"
+        greeting_text = self._greeting_text(member, is_join)
         
         try:
             # 音声合成・再生
-            await self._synthesize_and_play(member.guild.id, greeting_text, is_greeting=True)
+            await self._synthesize_and_play(member.guild.id, greeting_text, voice_client, is_greeting=True, wait=wait)
             logger.debug(f"Played greeting: {greeting_text}")
             
         except Exception as e:
             logger.error(f"Failed to play greeting for {member.display_name}: {e}")
     
-    async def _synthesize_and_play(self, guild_id: int, text: str, is_greeting: bool = False):
+    def _greeting_text(self, member: discord.Member, is_join: bool) -> str:
+        """
+        挨拶テキストを生成
+        
+        Args:
+            member: 対象メンバー
+            is_join: 参加時の場合 True、退出時の場合 False
+            
+        Returns:
+            挨拶テキスト
+        """
+        # 表示名に含まれる URL は読み上げず「URL」に置換
+        display_name = self.text_processor.replace_urls(member.display_name)
+        return display_name + (JOIN_GREETING_SUFFIX if is_join else LEAVE_GREETING_SUFFIX)
+    
+    async def _synthesize_and_play(
+        self,
+        guild_id: int,
+        text: str,
+        voice_client: Optional[discord.VoiceClient],
+        is_greeting: bool = False,
+        wait: bool = False
+    ):
         """
-        テキストを音声合成して再生
+        テキストを音声合成して再生キューに追加
         
         Args:
             guild_id: サーバーID
             text: 合成するテキスト
+            voice_client: このサーバーのボイスクライアント（再生時に接続状態を再確認する）
             is_greeting: 挨拶音声の場合 True
+            wait: 再生完了まで待機する場合 True
         """
-        voice_client = self.bot.get_voice_client_for_guild(guild_id)
         if not voice_client:
             return
         
-        # 音声が再生中の場合は待機（最大10秒）
-        wait_timeout = 10.0
-        start_time = asyncio.get_event_loop().time()
-        while voice_client.is_playing():
-            await asyncio.sleep(0.05)  # レスポンシブ性向上
-            # タイムアウトチェック
-            if asyncio.get_event_loop().time() - start_time > wait_timeout:
-                logger.warning("Voice playback wait timeout, proceeding anyway")
-                break
-        
         try:
-            # キャッシュをチェック
-            tts_settings = self.tts_client.default_settings.copy()
-            cached_audio = await self.cache_manager.get_cached_audio(text, tts_settings)
+            # 事前計算済みの設定ハッシュを使用（設定のコピー・シリアライズを行わない）
+            settings_key = self.tts_client.default_settings_key
             
-            if cached_audio:
-                logger.debug(f"Using cached audio for: {text[:20]}...")
-                audio_data = cached_audio
-            else:
-                # TTS API で音声合成
-                logger.debug(f"Synthesizing audio for: {text[:20]}...")
-                audio_data = await self.tts_client.synthesize_speech(text)
-                
-                # キャッシュに保存
-                await self.cache_manager.save_audio_cache(text, tts_settings, audio_data)
+            # キャッシュにある場合はデコード済み PCM を直接再生（FFmpeg を起動しない）
+            pcm_path = await self.cache_manager.get_cached_path(text, settings_key, pcm=True)
+            cache_path = None
+            if pcm_path is None:
+                cache_path = await self.cache_manager.get_cached_path(text, settings_key)
+            if pcm_path is None and cache_path is None:
+                # TTS API で合成してキャッシュに保存（同じテキストの同時合成は1回にまとめる）
+                audio_data = await self.cache_manager.get_or_synthesize(
+                    text, settings_key, lambda: self.tts_client.synthesize_speech(text), store_pcm=is_greeting
+                )
+                # 保存されたキャッシュファイルから再生（PCM は挨拶のみ保存）
+                if is_greeting:
+                    pcm_path = await self.cache_manager.get_cached_path(text, settings_key, pcm=True)
+                if pcm_path is None:
+                    cache_path = await self.cache_manager.get_cached_path(text, settings_key)
             
-            # 音声ファイルから AudioSource を作成
-            audio_io = io.BytesIO(audio_data)
-            audio_source = discord.FFmpegPCMAudio(audio_io, pipe=True)
+            # AudioSource を作成（PCM が無い場合は FFmpeg でデコード、キャッシュ保存に失敗した場合はパイプで渡す）
+            if pcm_path is not None:
+                audio_source = PCMFileAudio(str(pcm_path))
+            elif cache_path is not None:
+                audio_source = discord.FFmpegPCMAudio(str(cache_path))
+            else:
+                audio_source = discord.FFmpegPCMAudio(io.BytesIO(audio_data), pipe=True)
             
-            # 音声再生
-            voice_client.play(audio_source)
-            logger.debug(f"Started playing TTS audio: {text[:30]}...")
+            # 再生キューに追加（再生中の音声があれば終了後に再生）
+            finished = self._enqueue_playback(guild_id, audio_source)
+            logger.debug(f"Queued TTS audio: {text[:30]}...")
             
         except Exception as e:
             logger.error(f"Failed to synthesize and play audio: {e}")
+            return
+        
+        if wait:
+            await finished
+    
+    def _enqueue_playback(self, guild_id: int, audio_source: discord.AudioSource) -> asyncio.Future:
+        """
+        音声ソースをギルドの再生キューに追加（再生ワーカーが未起動の場合は起動）
+        
+        Args:
+            guild_id: サーバーID
+            audio_source: 再生する音声ソース
+            
+        Returns:
+            再生完了（またはスキップ）時に完了する Future
+        """
+        play_queue = self._play_queues.get(guild_id)
+        if play_queue is None:
+            play_queue = self._play_queues[guild_id] = asyncio.Queue()
+            self._play_workers[guild_id] = asyncio.create_task(self._play_worker(guild_id, play_queue))
+        
+        finished = asyncio.get_running_loop().create_future()
+        play_queue.put_nowait((audio_source, finished))
+        return finished
+    
+    async def _play_worker(self, guild_id: int, play_queue: asyncio.Queue):
+        """
+        再生キューの音声を順番に再生（再生完了は after コールバックで通知）
+        
+        Args:
+            guild_id: サーバーID
+            play_queue: 再生キュー
+        """
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            audio_source, finished = await play_queue.get()
+            
+            try:
+                voice_client = self.bot.get_voice_client_for_guild(guild_id)
+                if not voice_client or not voice_client.is_connected():
+                    logger.debug(f"No voice client for playback in guild {guild_id}, skipping")
+                    audio_source.cleanup()
+                    continue
+                
+                # 読み上げの再生中は終了まで待機
+                state = self.bot.get_guild_state(guild_id, create=True)
+                async with state.play_lock:
+                    done = asyncio.Event()
+                    
+                    def _after(error: Optional[Exception]):
+                        if error:
+                            logger.error(f"Playback error in guild {guild_id}: {error}")
+                        loop.call_soon_threadsafe(done.set)
+                    
+                    voice_client.play(audio_source, after=_after)
+                    logger.debug(f"Started playing TTS audio in guild {guild_id}")
+                    
+                    try:
+                        await asyncio.wait_for(done.wait(), timeout=PLAYBACK_TIMEOUT)
+                    except asyncio.TimeoutError:
+                        logger.warning(f"Playback timeout in guild {guild_id}, stopping...")
+                        voice_client.stop()
+            
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to play audio in guild {guild_id}: {e}")
+            
+            finally:
+                if not finished.done():
+                    finished.set_result(None)
     
     @commands.command(name="join")
     async def join_voice_channel(self, ctx: commands.Context, *, channel: Optional[discord.VoiceChannel] = None):
@@ -317,7 +523,7 @@ class VoiceManager(commands.Cog):
         await ctx.send(f"テスト音声を再生します: 「{text}」")
         
         try:
-            await self._synthesize_and_play(ctx.guild.id, text)
+            await self._synthesize_and_play(ctx.guild.id, self.text_processor.replace_urls(text), voice_client)
             logger.info(f"TTS test played: {text}")
             
         except Exception as e:
@@ -0,0 +1,124 @@
+"""音声データ変換"""
+
+import io
+import logging
+import wave
+
+import discord
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+# Discord の再生フォーマット（48kHz / ステレオ / 16bit PCM）
+DISCORD_SAMPLE_RATE = 48000
+DISCORD_CHANNELS = 2
+# 20ms 分の PCM フレームサイズ（バイト）
+FRAME_SIZE = discord.opus.Encoder.FRAME_SIZE
+
+
+def decode_to_pcm(audio_data: bytes) -> bytes:
+    """
+    WAV音声を Discord 再生用の PCM（48kHz / ステレオ / s16le）に変換
+
+    FFmpeg サブプロセスを起動せずに変換するため、`discord.PCMAudio` で
+    そのまま再生できる。CPU処理のため `asyncio.to_thread` 経由で呼び出すこと。
+
+    Args:
+        audio_data: WAV形式の音声データ
+
+    Returns:
+        PCM音声データ（48kHz / ステレオ / s16le）
+
+    Raises:
+        ValueError: 未対応の音声形式
+    """
+    try:
+        with wave.open(io.BytesIO(audio_data), 'rb') as wav_file:
+            sample_width = wav_file.getsampwidth()
+            channels = wav_file.getnchannels()
+            sample_rate = wav_file.getframerate()
+            frames = wav_file.readframes(wav_file.getnframes())
+    except (wave.Error, EOFError) as e:
+        raise ValueError(f"Unsupported audio data: {e}") from e
+
+    if sample_width != 2:
+        raise ValueError(f"Unsupported sample width: {sample_width * 8}bit")
+
+    samples = np.frombuffer(frames, dtype='<i2').reshape(-1, channels)
+
+    # ステレオを超えるチャンネルは先頭2チャンネルのみ使用
+    if channels > DISCORD_CHANNELS:
+        samples = samples[:, :DISCORD_CHANNELS]
+
+    # 48kHz にリサンプリング（音声用途のため線形補間で十分）
+    if sample_rate != DISCORD_SAMPLE_RATE and len(samples) > 1:
+        output_length = int(round(len(samples) * DISCORD_SAMPLE_RATE / sample_rate))
+        source_positions = np.arange(len(samples))
+        output_positions = np.linspace(0, len(samples) - 1, output_length)
+        resampled = np.column_stack([
+            np.interp(output_positions, source_positions, samples[:, channel])
+            for channel in range(samples.shape[1])
+        ])
+        samples = np.clip(np.rint(resampled), -32768, 32767).astype('<i2')
+
+    # モノラルはステレオに複製
+    if samples.shape[1] == 1:
+        samples = np.repeat(samples, DISCORD_CHANNELS, axis=1)
+
+    pcm_data = np.ascontiguousarray(samples, dtype='<i2').tobytes()
+    logger.debug(f"Audio decoded to PCM: {len(audio_data)} bytes ({sample_rate}Hz, {channels}ch) -> {len(pcm_data)} bytes")
+    return pcm_data
+
+
+class PCMBufferAudio(discord.AudioSource):
+    """
+    メモリ上の PCM データ（48kHz / ステレオ / s16le）をそのまま再生する音声ソース
+
+    `discord.PCMAudio(io.BytesIO(...))` と異なりストリームを介さず
+    memoryview から直接フレームを切り出す。末尾の端数フレームは無音で埋めて再生する。
+    """
+
+    def __init__(self, pcm_data: bytes):
+        """
+        音声ソースを初期化
+
+        Args:
+            pcm_data: PCM音声データ（48kHz / ステレオ / s16le）
+        """
+        self._view = memoryview(pcm_data)
+        self._position = 0
+
+    def read(self) -> bytes:
+        start = self._position
+        if start >= len(self._view):
+            return b''
+
+        self._position = start + FRAME_SIZE
+        frame = self._view[start:self._position].tobytes()
+        if len(frame) < FRAME_SIZE:
+            frame += bytes(FRAME_SIZE - len(frame))
+        return frame
+
+    def cleanup(self):
+        self._view.release()
+
+
+class PCMFileAudio(discord.PCMAudio):
+    """
+    PCM ファイル（48kHz / ステレオ / s16le）を再生する音声ソース
+
+    再生終了時（cleanup）にファイルを閉じる。
+    """
+
+    def __init__(self, path: str):
+        """
+        音声ソースを初期化
+
+        Args:
+            path: PCM ファイルのパス
+        """
+        super().__init__(open(path, 'rb'))
+
+    def cleanup(self):
+        self.stream.close()
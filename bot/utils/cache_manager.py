@@ -3,16 +3,72 @@
 import hashlib
 import json
 import os
+import re
 import time
+import unicodedata
 import asyncio
 import aiofiles
+import aiosqlite
 import logging
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Mapping, List, Set, Tuple, Callable, Awaitable
 from datetime import datetime, timedelta
 
+from .lru_cache import BytesLRUCache
+from .audio_converter import decode_to_pcm
+
 logger = logging.getLogger(__name__)
 
+# キャッシュ形式のバージョン（キャッシュキーの生成方式を変更した場合に更新）
+CACHE_VERSION = 5
+
+# アクセス情報をメタデータファイルに書き出す間隔（秒）
+STATS_FLUSH_INTERVAL = 60.0
+
+# ファイルアクセス用ロックの数（2の累乗）
+LOCK_STRIPES = 64
+
+# 一括削除時に1回の DELETE 文で削除する件数
+DELETE_BATCH_SIZE = 32
+
+# キャッシュキー生成時に1つの半角スペースにまとめる空白（タブ・連続した空白）
+_WHITESPACE_RUN_PATTERN = re.compile(r'[ \t]+')
+
+
+def _normalize_cache_text(text: str) -> str:
+    """
+    キャッシュキー用にテキストを正規化（NFC・連続空白の圧縮・末尾空白の除去）
+    
+    見た目が同じテキストが別のキーにならないようにする。
+    ASCII や正規化済みのテキストは Quick Check で判定し、unicodedata.normalize を呼ばない。
+    
+    Args:
+        text: テキスト内容
+        
+    Returns:
+        正規化後のテキスト
+    """
+    if not unicodedata.is_normalized('NFC', text):
+        text = unicodedata.normalize('NFC', text)
+    return _WHITESPACE_RUN_PATTERN.sub(' ', text).rstrip()
+
+
+def make_settings_key(tts_settings: Mapping[str, Any]) -> str:
+    """
+    TTS設定からキャッシュキー用の設定ハッシュを生成
+    
+    設定が変わらない限り結果は同じため、呼び出し側で事前計算しておくことで
+    キャッシュ参照ごとのJSONシリアライズを省略できる。
+    
+    Args:
+        tts_settings: TTS設定
+        
+    Returns:
+        設定ハッシュ（16文字）
+    """
+    settings_string = json.dumps(dict(tts_settings), sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.blake2b(settings_string.encode('utf-8'), digest_size=8).hexdigest()
+
 
 class CacheManager:
     """音声キャッシュマネージャー"""
@@ -21,7 +77,9 @@ class CacheManager:
         self,
         cache_dir: str = "cache",
         expiry_hours: int = 24,
-        max_cache_size_mb: int = 500
+        max_cache_size_mb: int = 500,
+        memory_cache_entries: int = 32,
+        memory_cache_mb: int = 16
     ):
         """
         キャッシュマネージャーを初期化
@@ -30,6 +88,8 @@ class CacheManager:
             cache_dir: キャッシュディレクトリパス
             expiry_hours: キャッシュ有効期限（時間）
             max_cache_size_mb: 最大キャッシュサイズ（MB）
+            memory_cache_entries: メモリキャッシュの最大件数
+            memory_cache_mb: メモリキャッシュの最大サイズ（MB）
         """
         self.cache_dir = Path(cache_dir)
         self.expiry_hours = expiry_hours
@@ -38,107 +98,287 @@ class CacheManager:
         # キャッシュディレクトリを作成
         self.cache_dir.mkdir(exist_ok=True)
         
-        # ファイルアクセス用のロック
-        self._file_locks: Dict[str, asyncio.Lock] = {}
-        self._locks_lock = asyncio.Lock()
+        # ファイルアクセス用のロック（キャッシュキーで振り分ける固定数のロック）
+        self._lock_stripes: List[asyncio.Lock] = [asyncio.Lock() for _ in range(LOCK_STRIPES)]
+        
+        # 直近に使用した音声のメモリキャッシュ（ディスク読み込み・メタデータ更新を省略）
+        self._memory_cache = BytesLRUCache(
+            max_entries=memory_cache_entries,
+            max_bytes=memory_cache_mb * 1024 * 1024
+        )
+        
+        # アクセス情報（キャッシュキー -> (未反映のアクセス回数, 最終アクセス時刻)）
+        # ヒットごとにメタデータを書き換えず、定期的にまとめて書き出す
+        self._access_stats: Dict[str, Tuple[int, float]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        
+        # 合成中の音声（キャッシュキー -> 合成結果の Future）
+        # 同じテキストの同時リクエストは最初の合成結果を待ち合わせる
+        self._inflight: Dict[str, asyncio.Future] = {}
+        
+        # メタデータのインデックス（SQLite、初回アクセス時に接続）
+        self._db: Optional[aiosqlite.Connection] = None
+        self._db_lock = asyncio.Lock()
+        
+        # 現在のキャッシュサイズ（起動時に一度だけ集計し、以降は保存・削除時に増減）
+        self._current_size_bytes = 0
+        # キャッシュ済みのキー（未キャッシュのテキストはファイルを参照せずに判定）
+        self._known_keys: Set[str] = set()
+        self._load_cache_index()
         
         logger.info(f"Cache manager initialized: dir={cache_dir}, expiry={expiry_hours}h, max_size={max_cache_size_mb}MB")
     
-    def _generate_cache_key(self, text: str, tts_settings: Dict[str, Any]) -> str:
+    def _generate_cache_key(self, text: str, settings_key: str) -> str:
         """
         キャッシュキーを生成
         
         Args:
             text: テキスト内容
-            tts_settings: TTS設定
+            settings_key: make_settings_key で事前計算した設定ハッシュ
             
         Returns:
             ハッシュベースのキャッシュキー
         """
-        # テキストと設定を組み合わせて一意なキーを生成
-        key_data = {
-            "text": text,
-            "settings": tts_settings
-        }
-        
-        # 辞書をソート済みJSONにシリアライズしてハッシュ化
-        key_string = json.dumps(key_data, sort_keys=True, ensure_ascii=False)
-        hash_object = hashlib.sha256(key_string.encode('utf-8'))
-        return hash_object.hexdigest()[:16]  # 16文字に短縮
+        # 設定ハッシュとテキストを組み合わせて一意なキーを生成
+        # （暗号強度は不要なため SHA-256 より高速な BLAKE2b を使用）
+        hash_object = hashlib.blake2b(settings_key.encode('ascii'), digest_size=8)
+        hash_object.update(_normalize_cache_text(text).encode('utf-8'))
+        return hash_object.hexdigest()  # 16文字
     
     def _get_cache_file_path(self, cache_key: str) -> Path:
         """キャッシュファイルのパスを取得"""
         return self.cache_dir / f"{cache_key}.wav"
     
-    def _get_metadata_file_path(self, cache_key: str) -> Path:
-        """メタデータファイルのパスを取得"""
-        return self.cache_dir / f"{cache_key}.meta"
-    
-    async def _get_file_lock(self, cache_key: str) -> asyncio.Lock:
-        """ファイル固有のロックを取得"""
-        async with self._locks_lock:
-            if cache_key not in self._file_locks:
-                self._file_locks[cache_key] = asyncio.Lock()
-            return self._file_locks[cache_key]
-    
-    async def _write_metadata(self, cache_key: str, text: str, tts_settings: Dict[str, Any]):
-        """メタデータを書き込み"""
-        metadata = {
-            "text": text,
-            "tts_settings": tts_settings,
-            "created_at": time.time(),
-            "access_count": 1,
-            "last_accessed": time.time()
-        }
+    def _get_pcm_file_path(self, cache_key: str) -> Path:
+        """デコード済み PCM（48kHz / ステレオ / s16le）ファイルのパスを取得"""
+        return self.cache_dir / f"{cache_key}.pcm"
+    
+    def _get_index_file_path(self) -> Path:
+        """メタデータインデックス（SQLite）のパスを取得"""
+        return self.cache_dir / "index.db"
+    
+    def _get_version_file_path(self) -> Path:
+        """キャッシュ形式バージョンファイルのパスを取得"""
+        return self.cache_dir / ".cache_version"
+    
+    async def migrate_if_needed(self) -> bool:
+        """
+        キャッシュ形式のバージョンを確認し、不一致の場合は既存キャッシュを削除
+        
+        Returns:
+            キャッシュを削除した場合 True
+        """
+        version_file = self._get_version_file_path()
+        
+        try:
+            current_version = int(version_file.read_text(encoding='utf-8').strip())
+        except (OSError, ValueError):
+            current_version = None
+        
+        if current_version == CACHE_VERSION:
+            return False
+        
+        # 旧形式のキャッシュは新しいキーで参照されないため削除
+        # （.meta は旧形式のメタデータファイル）
+        self._memory_cache.clear()
+        self._access_stats.clear()
+        deleted_count = 0
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith((".wav", ".pcm", ".meta")) and entry.is_file(follow_symlinks=False):
+                    try:
+                        os.unlink(entry.path)
+                        deleted_count += 1
+                    except OSError as e:
+                        logger.warning(f"Failed to delete {entry.path}: {e}")
+        
+        self._load_cache_index()
+        
+        db = await self._get_db()
+        await db.execute("DELETE FROM cache")
+        await db.commit()
+        
+        version_file.write_text(str(CACHE_VERSION), encoding='utf-8')
+        logger.info(f"Cache migrated: version {current_version} -> {CACHE_VERSION}, deleted {deleted_count} files")
+        return True
+    
+    def _load_cache_index(self):
+        """キャッシュディレクトリを走査し、キャッシュサイズとキャッシュ済みキーを集計"""
+        # 1回の走査でサイズ（音声・PCM）とキャッシュ済みキー（音声ファイルのみ）を集計
+        total_size = 0
+        known_keys = set()
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith((".wav", ".pcm")) or not entry.is_file(follow_symlinks=False):
+                    continue
+                total_size += entry.stat(follow_symlinks=False).st_size
+                if name.endswith(".wav"):
+                    known_keys.add(name[:-4])
+        self._current_size_bytes = total_size
+        self._known_keys = known_keys
+    
+    def _get_file_lock(self, cache_key: str) -> asyncio.Lock:
+        """
+        キャッシュキーに対応するロックを取得
+        
+        キーごとにロックを生成せず固定数のロックを共有するため、メモリ使用量はキャッシュ件数に依存しない。
+        別のキーが同じロックを共有しても、扱うファイルが異なるため待ちが発生するだけで問題はない。
+        """
+        return self._lock_stripes[int(cache_key[:2], 16) & (LOCK_STRIPES - 1)]
+    
+    async def _get_db(self) -> aiosqlite.Connection:
+        """メタデータインデックスへの接続を取得（初回はテーブルを作成）"""
+        if self._db is not None:
+            return self._db
         
-        metadata_path = self._get_metadata_file_path(cache_key)
-        async with aiofiles.open(metadata_path, 'w', encoding='utf-8') as f:
-            await f.write(json.dumps(metadata, ensure_ascii=False, indent=2))
+        async with self._db_lock:
+            if self._db is None:
+                db = await aiosqlite.connect(self._get_index_file_path())
+                await db.execute("PRAGMA journal_mode=WAL")
+                await db.execute("PRAGMA synchronous=NORMAL")
+                await db.execute(
+                    "CREATE TABLE IF NOT EXISTS cache ("
+                    "cache_key TEXT PRIMARY KEY, "
+                    "created_at REAL NOT NULL, "
+                    "last_accessed REAL NOT NULL, "
+                    "access_count INTEGER NOT NULL DEFAULT 0, "
+                    "size INTEGER NOT NULL DEFAULT 0)"
+                )
+                await db.execute("CREATE INDEX IF NOT EXISTS idx_cache_last_accessed ON cache (last_accessed)")
+                await db.commit()
+                self._db = db
+        return self._db
+    
+    async def _write_metadata(self, cache_key: str, size: int):
+        """
+        メタデータを書き込み
+        
+        有効期限・削除順の判定に使う固定長の値のみを保存する
+        （テキスト・設定はキャッシュキーに含まれるため保存しない）。
+        
+        Args:
+            cache_key: キャッシュキー
+            size: キャッシュファイルの合計サイズ（バイト）
+        """
+        now = time.time()
+        db = await self._get_db()
+        await db.execute(
+            "INSERT OR REPLACE INTO cache "
+            "(cache_key, created_at, last_accessed, access_count, size) "
+            "VALUES (?, ?, ?, 1, ?)",
+            (cache_key, now, now, size)
+        )
+        await db.commit()
     
     async def _read_metadata(self, cache_key: str) -> Optional[Dict[str, Any]]:
         """メタデータを読み込み"""
-        metadata_path = self._get_metadata_file_path(cache_key)
+        try:
+            db = await self._get_db()
+            async with db.execute(
+                "SELECT created_at, last_accessed, access_count, size FROM cache WHERE cache_key = ?",
+                (cache_key,)
+            ) as cursor:
+                row = await cursor.fetchone()
+        except aiosqlite.Error as e:
+            logger.warning(f"Failed to read metadata {cache_key}: {e}")
+            return None
         
-        if not metadata_path.exists():
+        if row is None:
             return None
         
+        return {
+            "created_at": row[0],
+            "last_accessed": row[1],
+            "access_count": row[2],
+            "size": row[3]
+        }
+    
+    def _update_access_metadata(self, cache_key: str):
+        """アクセス情報を更新（メモリ上で記録し、定期的にメタデータへ反映）"""
+        access_count, _ = self._access_stats.get(cache_key, (0, 0.0))
+        self._access_stats[cache_key] = (access_count + 1, time.time())
+    
+    async def _flush_stats(self):
+        """メモリ上のアクセス情報をメタデータインデックスに反映"""
+        if not self._access_stats:
+            return
+        
+        access_stats, self._access_stats = self._access_stats, {}
         try:
-            async with aiofiles.open(metadata_path, 'r', encoding='utf-8') as f:
-                content = await f.read()
-                return json.loads(content)
-        except (json.JSONDecodeError, IOError) as e:
-            logger.warning(f"Failed to read metadata {cache_key}: {e}")
-            return None
+            db = await self._get_db()
+            await db.executemany(
+                "UPDATE cache SET access_count = access_count + ?, last_accessed = MAX(last_accessed, ?) "
+                "WHERE cache_key = ?",
+                [
+                    (access_count, last_accessed, cache_key)
+                    for cache_key, (access_count, last_accessed) in access_stats.items()
+                ]
+            )
+            await db.commit()
+        except aiosqlite.Error as e:
+            logger.warning(f"Failed to update metadata: {e}")
+            return
+        
+        logger.debug(f"Access stats flushed: {len(access_stats)} entries")
     
-    async def _update_access_metadata(self, cache_key: str):
-        """アクセス情報を更新"""
-        metadata = await self._read_metadata(cache_key)
-        if metadata:
-            metadata["access_count"] = metadata.get("access_count", 0) + 1
-            metadata["last_accessed"] = time.time()
-            
-            metadata_path = self._get_metadata_file_path(cache_key)
-            async with aiofiles.open(metadata_path, 'w', encoding='utf-8') as f:
-                await f.write(json.dumps(metadata, ensure_ascii=False, indent=2))
+    async def _stats_flusher(self):
+        """アクセス情報を定期的に書き出すバックグラウンドタスク"""
+        while True:
+            await asyncio.sleep(STATS_FLUSH_INTERVAL)
+            try:
+                await self._flush_stats()
+            except Exception as e:
+                logger.error(f"Failed to flush access stats: {e}")
+    
+    def start(self):
+        """バックグラウンド処理（アクセス情報の定期書き出し）を開始"""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._stats_flusher())
     
-    async def cache_exists(self, text: str, tts_settings: Dict[str, Any]) -> bool:
+    async def close(self):
+        """バックグラウンド処理を停止し、未反映のアクセス情報を書き出してインデックスを閉じる"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self._flush_stats()
+        
+        if self._db is not None:
+            await self._db.close()
+            self._db = None
+    
+    async def cache_exists(self, text: str, settings_key: str) -> bool:
         """
         キャッシュが存在するかチェック
         
         Args:
             text: テキスト内容
-            tts_settings: TTS設定
+            settings_key: 事前計算した設定ハッシュ（make_settings_key）
             
         Returns:
             キャッシュが存在し有効な場合 True
         """
-        cache_key = self._generate_cache_key(text, tts_settings)
-        cache_file = self._get_cache_file_path(cache_key)
+        cache_key = self._generate_cache_key(text, settings_key)
+        if cache_key not in self._known_keys:
+            return False
         
+        cache_file = self._get_cache_file_path(cache_key)
         if not cache_file.exists():
+            self._known_keys.discard(cache_key)
             return False
         
-        # 有効期限チェック
+        return not await self._delete_if_expired(cache_key)
+    
+    async def _delete_if_expired(self, cache_key: str) -> bool:
+        """
+        有効期限をチェックし、期限切れの場合はキャッシュを削除
+        
+        Args:
+            cache_key: キャッシュキー
+            
+        Returns:
+            期限切れで削除した場合 True
+        """
         metadata = await self._read_metadata(cache_key)
         if metadata:
             created_at = metadata.get("created_at", 0)
@@ -146,169 +386,372 @@ class CacheManager:
             
             if time.time() > expiry_time:
                 logger.debug(f"Cache expired: {cache_key}")
-                # 期限切れキャッシュを削除
                 await self._delete_cache_files(cache_key)
-                return False
+                return True
         
-        return True
+        return False
     
-    async def get_cached_audio(self, text: str, tts_settings: Dict[str, Any]) -> Optional[bytes]:
+    async def get_cached_audio(self, text: str, settings_key: str) -> Optional[bytes]:
         """
         キャッシュされた音声データを取得
         
         Args:
             text: テキスト内容
-            tts_settings: TTS設定
+            settings_key: 事前計算した設定ハッシュ（make_settings_key）
             
         Returns:
             音声データ。キャッシュが存在しない場合は None
         """
-        cache_key = self._generate_cache_key(text, tts_settings)
+        cache_key = self._generate_cache_key(text, settings_key)
         
-        # キャッシュ存在チェック
-        if not await self.cache_exists(text, tts_settings):
+        # メモリキャッシュを優先（ヒット時はファイルを開かない）
+        audio_data = self._memory_cache.get(cache_key)
+        if audio_data is not None:
+            self._update_access_metadata(cache_key)
+            logger.debug(f"Memory cache hit: {cache_key} ({len(audio_data)} bytes)")
+            return audio_data
+        
+        # 未キャッシュのテキストはファイルを開かずに判定
+        if cache_key not in self._known_keys:
             return None
         
         # ファイルロックを取得
-        file_lock = await self._get_file_lock(cache_key)
+        file_lock = self._get_file_lock(cache_key)
         async with file_lock:
             cache_file = self._get_cache_file_path(cache_key)
             
             try:
+                # 存在チェックを兼ねて直接読み込む（存在しない場合は例外で判定）
                 async with aiofiles.open(cache_file, 'rb') as f:
                     audio_data = await f.read()
                 
+                # 有効期限チェック（メタデータは1回だけ参照）
+                if await self._delete_if_expired(cache_key):
+                    return None
+                
                 # アクセス情報を更新
-                await self._update_access_metadata(cache_key)
+                self._update_access_metadata(cache_key)
+                self._memory_cache.put(cache_key, audio_data)
                 
                 logger.debug(f"Cache hit: {cache_key} ({len(audio_data)} bytes)")
                 return audio_data
                 
+            except FileNotFoundError:
+                self._known_keys.discard(cache_key)
+                return None
             except IOError as e:
                 logger.error(f"Failed to read cache file {cache_key}: {e}")
                 return None
     
-    async def save_audio_cache(self, text: str, tts_settings: Dict[str, Any], audio_data: bytes):
+    def get_cache_path(self, text: str, settings_key: str) -> Path:
+        """
+        キャッシュファイルのパスを取得（存在チェックは行わない）
+        
+        Args:
+            text: テキスト内容
+            settings_key: 事前計算した設定ハッシュ（make_settings_key）
+            
+        Returns:
+            キャッシュファイルのパス
+        """
+        return self._get_cache_file_path(self._generate_cache_key(text, settings_key))
+    
+    async def get_cached_path(
+        self,
+        text: str,
+        settings_key: str,
+        pcm: bool = False
+    ) -> Optional[Path]:
+        """
+        有効なキャッシュファイルのパスを取得（音声データは読み込まない）
+        
+        Args:
+            text: テキスト内容
+            settings_key: 事前計算した設定ハッシュ（make_settings_key）
+            pcm: デコード済み PCM ファイルのパスを取得する場合 True
+            
+        Returns:
+            キャッシュファイルのパス。キャッシュが存在しない場合は None
+        """
+        cache_key = self._generate_cache_key(text, settings_key)
+        if cache_key not in self._known_keys:
+            return None
+        
+        if pcm:
+            cache_file = self._get_pcm_file_path(cache_key)
+        else:
+            cache_file = self._get_cache_file_path(cache_key)
+        
+        if not cache_file.exists() or await self._delete_if_expired(cache_key):
+            return None
+        
+        self._update_access_metadata(cache_key)
+        logger.debug(f"Cache hit (path): {cache_file.name}")
+        return cache_file
+    
+    async def get_or_synthesize(
+        self,
+        text: str,
+        settings_key: str,
+        synthesize: Callable[[], Awaitable[bytes]],
+        store_pcm: bool = False
+    ) -> bytes:
+        """
+        キャッシュされた音声データを取得し、存在しない場合は合成してキャッシュに保存
+        
+        同じテキスト・設定の合成が進行中の場合は、重複してリクエストせずにその結果を待つ。
+        
+        Args:
+            text: テキスト内容
+            settings_key: 事前計算した設定ハッシュ（make_settings_key）
+            synthesize: 音声データを合成するコルーチン関数
+            store_pcm: デコード済み PCM ファイルも保存する場合 True（挨拶など繰り返し再生する音声向け）
+            
+        Returns:
+            音声データ
+            
+        Raises:
+            Exception: 合成処理で発生した例外
+        """
+        cache_key = self._generate_cache_key(text, settings_key)
+        
+        while (inflight := self._inflight.get(cache_key)) is not None:
+            logger.debug(f"Waiting for in-flight synthesis: {cache_key}")
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # 自身がキャンセルされた場合はそのまま伝播
+                if not inflight.cancelled() or asyncio.current_task().cancelling():
+                    raise
+                # 合成元のタスクのみキャンセルされた場合は、自身が合成を引き継ぐ
+                logger.debug(f"In-flight synthesis cancelled, retrying: {cache_key}")
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            audio_data = await self.get_cached_audio(text, settings_key)
+            if audio_data is None:
+                audio_data = await synthesize()
+                await self.save_audio_cache(text, settings_key, audio_data, store_pcm=store_pcm)
+            
+            future.set_result(audio_data)
+            return audio_data
+        
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                future.exception()  # 待機者がいない場合の未取得警告を抑止
+            raise
+        
+        finally:
+            self._inflight.pop(cache_key, None)
+    
+    async def save_audio_cache(
+        self,
+        text: str,
+        settings_key: str,
+        audio_data: bytes,
+        store_pcm: bool = False
+    ):
         """
         音声データをキャッシュに保存
         
         Args:
             text: テキスト内容
-            tts_settings: TTS設定
+            settings_key: 事前計算した設定ハッシュ（make_settings_key）
             audio_data: 音声データ
+            store_pcm: デコード済み PCM ファイルも保存する場合 True
         """
         if not audio_data:
             logger.warning("Cannot cache empty audio data")
             return
         
-        cache_key = self._generate_cache_key(text, tts_settings)
+        cache_key = self._generate_cache_key(text, settings_key)
+        
+        # 繰り返し再生する音声は、再生時に FFmpeg を起動せずに済むよう保存時に一度だけ PCM にデコード
+        # （PCM は WAV の約2倍のサイズになるため、通常のメッセージでは保存しない）
+        pcm_data = None
+        if store_pcm:
+            try:
+                pcm_data = await asyncio.to_thread(decode_to_pcm, audio_data)
+            except ValueError as e:
+                logger.debug(f"PCM decode skipped for {cache_key}: {e}")
         
         # ファイルロックを取得
-        file_lock = await self._get_file_lock(cache_key)
+        file_lock = self._get_file_lock(cache_key)
         async with file_lock:
             cache_file = self._get_cache_file_path(cache_key)
+            pcm_file = self._get_pcm_file_path(cache_key)
             
             try:
+                # 上書きする場合は既存ファイル分をサイズから差し引く（PCM は書き込む場合のみ）
+                self._current_size_bytes -= self._get_file_size(cache_file)
+                if pcm_data is not None:
+                    self._current_size_bytes -= self._get_file_size(pcm_file)
+                
                 # 音声ファイルを保存
                 async with aiofiles.open(cache_file, 'wb') as f:
                     await f.write(audio_data)
+                self._known_keys.add(cache_key)
+                
+                cache_size = len(audio_data)
+                if pcm_data is not None:
+                    async with aiofiles.open(pcm_file, 'wb') as f:
+                        await f.write(pcm_data)
+                    cache_size += len(pcm_data)
+                self._current_size_bytes += cache_size
                 
                 # メタデータを保存
-                await self._write_metadata(cache_key, text, tts_settings)
+                await self._write_metadata(cache_key, cache_size)
+                self._memory_cache.put(cache_key, audio_data)
                 
-                logger.debug(f"Cache saved: {cache_key} ({len(audio_data)} bytes)")
+                logger.debug(f"Cache saved: {cache_key} ({cache_size} bytes)")
                 
                 # キャッシュサイズチェック・クリーンアップ
                 await self._cleanup_if_needed()
                 
-            except IOError as e:
+            except (IOError, aiosqlite.Error) as e:
                 logger.error(f"Failed to save cache {cache_key}: {e}")
     
     async def _delete_cache_files(self, cache_key: str):
         """キャッシュファイルとメタデータを削除"""
-        cache_file = self._get_cache_file_path(cache_key)
-        metadata_file = self._get_metadata_file_path(cache_key)
+        await self._delete_cache_entries([cache_key])
+    
+    async def _delete_cache_entries(self, cache_keys: List[str]):
+        """
+        複数のキャッシュファイルとメタデータをまとめて削除
+        
+        インデックスからの削除は DELETE_BATCH_SIZE 件ごとに1回の DELETE 文・コミットで行う。
+        
+        Args:
+            cache_keys: 削除するキャッシュキーのリスト
+        """
+        for start in range(0, len(cache_keys), DELETE_BATCH_SIZE):
+            batch = cache_keys[start:start + DELETE_BATCH_SIZE]
+            
+            file_paths = []
+            for cache_key in batch:
+                self._memory_cache.pop(cache_key)
+                self._access_stats.pop(cache_key, None)
+                self._known_keys.discard(cache_key)
+                file_paths.append(self._get_cache_file_path(cache_key))
+                file_paths.append(self._get_pcm_file_path(cache_key))
+            
+            # ファイル削除はイベントループを止めないよう、バッチごとに1回だけスレッドに渡す
+            # （スレッド待機中の保存による加算を失わないよう、削除完了後に差し引く）
+            freed_bytes = await asyncio.to_thread(self._unlink_files, file_paths)
+            self._current_size_bytes -= freed_bytes
+            
+            try:
+                db = await self._get_db()
+                placeholders = ",".join("?" * len(batch))
+                await db.execute(f"DELETE FROM cache WHERE cache_key IN ({placeholders})", batch)
+                await db.commit()
+            except aiosqlite.Error as e:
+                logger.warning(f"Failed to delete metadata ({len(batch)} entries): {e}")
+    
+    @staticmethod
+    def _unlink_files(file_paths: List[Path]) -> int:
+        """
+        ファイルをまとめて削除（ワーカースレッドで実行）
         
-        for file_path in [cache_file, metadata_file]:
+        Args:
+            file_paths: 削除するファイルのパス（存在しないものは無視）
+            
+        Returns:
+            削除したファイルの合計サイズ（バイト）
+        """
+        deleted_size = 0
+        for file_path in file_paths:
             try:
-                if file_path.exists():
-                    file_path.unlink()
+                file_size = os.stat(file_path).st_size
+                os.unlink(file_path)
+                deleted_size += file_size
+            except FileNotFoundError:
+                pass
             except OSError as e:
                 logger.warning(f"Failed to delete {file_path}: {e}")
+        return deleted_size
     
-    async def _get_cache_size(self) -> int:
-        """現在のキャッシュサイズを取得（バイト）"""
-        total_size = 0
-        for file_path in self.cache_dir.iterdir():
-            if file_path.is_file():
-                total_size += file_path.stat().st_size
-        return total_size
+    @staticmethod
+    def _get_file_size(file_path: Path) -> int:
+        """ファイルサイズを取得（存在しない場合は 0）"""
+        try:
+            return file_path.stat().st_size
+        except FileNotFoundError:
+            return 0
     
     async def _cleanup_if_needed(self):
         """必要に応じてキャッシュをクリーンアップ"""
-        current_size = await self._get_cache_size()
+        current_size = self._current_size_bytes
         
         if current_size <= self.max_cache_size_bytes:
             return
         
         logger.info(f"Cache size ({current_size / 1024 / 1024:.1f}MB) exceeds limit, cleaning up...")
         
-        # メタデータ付きキャッシュファイルを収集
-        cache_files = []
-        for wav_file in self.cache_dir.glob("*.wav"):
-            cache_key = wav_file.stem
-            metadata = await self._read_metadata(cache_key)
-            if metadata:
-                cache_files.append({
-                    "key": cache_key,
-                    "size": wav_file.stat().st_size,
-                    "last_accessed": metadata.get("last_accessed", 0),
-                    "access_count": metadata.get("access_count", 0)
-                })
-        
-        # LRU (最近使用頻度の低い順) でソート
-        cache_files.sort(key=lambda x: (x["last_accessed"], x["access_count"]))
+        # メタデータ未反映のアクセス情報を先に反映
+        await self._flush_stats()
         
-        # サイズ制限内になるまで削除
+        # LRU (最近使用頻度の低い順) にインデックスから取得し、80%まで削減できる分を選択
+        target_size = self.max_cache_size_bytes * 0.8
+        keys_to_delete = []
         deleted_size = 0
-        for cache_info in cache_files:
-            await self._delete_cache_files(cache_info["key"])
-            deleted_size += cache_info["size"]
-            
-            current_size -= cache_info["size"]
-            if current_size <= self.max_cache_size_bytes * 0.8:  # 80%まで削減
-                break
+        db = await self._get_db()
+        async with db.execute(
+            "SELECT cache_key, size FROM cache ORDER BY last_accessed ASC, access_count ASC"
+        ) as cursor:
+            async for cache_key, size in cursor:
+                keys_to_delete.append(cache_key)
+                deleted_size += size
+                if current_size - deleted_size <= target_size:
+                    break
+        
+        # サイズ制限内になるまで削除
+        await self._delete_cache_entries(keys_to_delete)
         
         logger.info(f"Cache cleanup completed: deleted {deleted_size / 1024 / 1024:.1f}MB")
     
+    def _scan_cache_files(self, suffixes: Tuple[str, ...] = (".wav",)) -> List[Tuple[str, os.stat_result]]:
+        """
+        キャッシュファイルを stat 情報付きで列挙
+        
+        Args:
+            suffixes: 対象とするファイルの拡張子（いずれも4文字）
+            
+        Returns:
+            (キャッシュキー, stat 情報) のリスト
+        """
+        # Path.glob + Path.stat より Path オブジェクト生成が少なく済む
+        with os.scandir(self.cache_dir) as entries:
+            return [
+                (entry.name[:-4], entry.stat(follow_symlinks=False))
+                for entry in entries
+                if entry.name.endswith(suffixes) and entry.is_file(follow_symlinks=False)
+            ]
+    
     async def cleanup_expired_cache(self):
         """期限切れキャッシュを削除"""
-        current_time = time.time()
-        expired_count = 0
+        # 音声ファイルは作成後に書き換えないため、更新時刻を作成時刻として扱う
+        # （メタデータファイルを1件ずつ読む必要がない）
+        expiry_threshold = time.time() - self.expiry_hours * 3600
+        cache_files = await asyncio.to_thread(self._scan_cache_files)
+        expired_keys = [cache_key for cache_key, stat in cache_files if stat.st_mtime < expiry_threshold]
         
-        for wav_file in self.cache_dir.glob("*.wav"):
-            cache_key = wav_file.stem
-            metadata = await self._read_metadata(cache_key)
-            
-            if metadata:
-                created_at = metadata.get("created_at", 0)
-                expiry_time = created_at + (self.expiry_hours * 3600)
-                
-                if current_time > expiry_time:
-                    await self._delete_cache_files(cache_key)
-                    expired_count += 1
+        await self._delete_cache_entries(expired_keys)
         
-        if expired_count > 0:
-            logger.info(f"Expired cache cleanup: deleted {expired_count} files")
+        if expired_keys:
+            logger.info(f"Expired cache cleanup: deleted {len(expired_keys)} files")
     
     def get_cache_stats(self) -> Dict[str, Any]:
-        """キャッシュ統計情報を取得"""
-        cache_files = list(self.cache_dir.glob("*.wav"))
-        total_size = sum(f.stat().st_size for f in cache_files)
+        """キャッシュ統計情報を取得（ディレクトリは走査せず、保存・削除時に更新している値を返す）"""
+        total_size = self._current_size_bytes
         
         return {
             "cache_dir": str(self.cache_dir),
-            "file_count": len(cache_files),
+            "file_count": len(self._known_keys),
             "total_size_bytes": total_size,
             "total_size_mb": round(total_size / 1024 / 1024, 2),
             "expiry_hours": self.expiry_hours,
@@ -1,9 +1,10 @@
 """統一エラーハンドリング"""
 
+import functools
 import logging
 import traceback
-from typing import Optional, Any, Dict
-from enum import Enum
+from typing import Optional, Any, Dict, List
+from enum import Enum, IntEnum
 import discord
 from discord.ext import commands
 
@@ -18,15 +19,40 @@ class ErrorSeverity(Enum):
     CRITICAL = "critical" # 上記 + システム停止検討
 
 
-class ErrorCategory(Enum):
-    """エラーカテゴリ"""
-    NETWORK = "network"
-    API = "api"
-    VOICE = "voice"
-    CACHE = "cache"
-    PERMISSION = "permission"
-    USER_INPUT = "user_input"
-    SYSTEM = "system"
+class ErrorCategory(IntEnum):
+    """エラーカテゴリ（値はエラー統計のインデックス）"""
+    NETWORK = 0
+    API = 1
+    VOICE = 2
+    CACHE = 3
+    PERMISSION = 4
+    USER_INPUT = 5
+    SYSTEM = 6
+
+
+# (カテゴリ, 統計情報のキー) の組（統計情報のキーはカテゴリ名の小文字表記）
+_CATEGORY_VALUES = tuple((category, category.name.lower()) for category in ErrorCategory)
+
+# 重要度ごとのログレベル
+_SEVERITY_TO_LOGLEVEL = {
+    ErrorSeverity.CRITICAL: logging.CRITICAL,
+    ErrorSeverity.HIGH: logging.ERROR,
+    ErrorSeverity.MEDIUM: logging.WARNING,
+    ErrorSeverity.LOW: logging.INFO,
+}
+
+# カテゴリごとのユーザー向けメッセージ（USER_INPUT は入力内容を含めるため個別に生成）
+_CATEGORY_TO_USER_MSG = {
+    ErrorCategory.API: "音声合成サービスで問題が発生しました。しばらくしてからお試しください。",
+    ErrorCategory.VOICE: "音声機能で問題が発生しました。ボイスチャンネルの状態をご確認ください。",
+    ErrorCategory.NETWORK: "ネットワーク接続で問題が発生しました。しばらくしてからお試しください。",
+    ErrorCategory.CACHE: "キャッシュ処理でエラーが発生しましたが、動作に影響はありません。",
+    ErrorCategory.PERMISSION: "権限不足です。管理者に必要な権限の付与をお問い合わせください。",
+}
+_DEFAULT_USER_MSG = "システムエラーが発生しました。開発者に報告されました。"
+
+# ユーザーに通知する重要度
+_NOTIFY_SEVERITIES = frozenset({ErrorSeverity.MEDIUM, ErrorSeverity.HIGH})
 
 
 class YomiageError(Exception):
@@ -34,18 +60,29 @@ class YomiageError(Exception):
     
     def __init__(
         self,
-        message: str,
+        message: Optional[str],
         severity: ErrorSeverity = ErrorSeverity.MEDIUM,
         category: ErrorCategory = ErrorCategory.SYSTEM,
         context: Optional[Dict[str, Any]] = None,
         original_error: Optional[Exception] = None
     ):
-        self.message = message
+        self._message = message
+        self._fn_name: Optional[str] = None  # 変換元の関数名（handle_errors で設定）
         self.severity = severity
         self.category = category
         self.context = context or {}
         self.original_error = original_error
         super().__init__(message)
+    
+    @property
+    def message(self) -> str:
+        """エラーメッセージ（handle_errors で変換した例外は参照時に生成）"""
+        if self._message is None:
+            self._message = f"Error in {self._fn_name}: {self.original_error}"
+        return self._message
+    
+    def __str__(self) -> str:
+        return self.message
 
 
 class TTSAPIError(YomiageError):
@@ -91,9 +128,14 @@ class ErrorHandler:
     
     def __init__(self, bot: Optional[commands.Bot] = None):
         self.bot = bot
-        self.error_stats: Dict[ErrorCategory, int] = {
-            category: 0 for category in ErrorCategory
-        }
+        # カテゴリごとのエラー数（ErrorCategory の値をインデックスとするリスト）
+        self.error_stats: List[int] = [0] * len(ErrorCategory)
+        self._total_errors = 0  # 全カテゴリの合計（統計取得時の集計を省略）
+    
+    def _bump(self, category: ErrorCategory):
+        """エラー統計を更新"""
+        self.error_stats[category] += 1
+        self._total_errors += 1
     
     async def handle_error(
         self,
@@ -126,7 +168,7 @@ class ErrorHandler:
                 return await self._handle_generic_error(error, context, user_context)
                 
         except Exception as handler_error:
-            logger.critical(f"Error handler failed: {handler_error}", exc_info=True)
+            logger.critical("Error handler failed: %s", handler_error, exc_info=True)
             return False
     
     async def _handle_yomiage_error(
@@ -136,35 +178,28 @@ class ErrorHandler:
     ) -> bool:
         """YomiageError を処理"""
         # 統計更新
-        self.error_stats[error.category] += 1
+        self._bump(error.category)
         
         # ログレベル決定
-        if error.severity == ErrorSeverity.CRITICAL:
-            log_level = logging.CRITICAL
-        elif error.severity == ErrorSeverity.HIGH:
-            log_level = logging.ERROR
-        elif error.severity == ErrorSeverity.MEDIUM:
-            log_level = logging.WARNING
-        else:
-            log_level = logging.INFO
+        log_level = _SEVERITY_TO_LOGLEVEL.get(error.severity, logging.INFO)
         
-        # ログ出力
-        context_info = f" | Context: {error.context}" if error.context else ""
-        logger.log(
-            log_level,
-            f"[{error.category.value.upper()}] {error.message}{context_info}"
-        )
-        
-        if error.original_error:
-            logger.log(log_level, f"Original error: {error.original_error}")
+        # ログ出力（出力対象外のレベルでは文字列を組み立てない）
+        if logger.isEnabledFor(log_level):
+            if error.context:
+                logger.log(log_level, "[%s] %s | Context: %s", error.category.name, error.message, error.context)
+            else:
+                logger.log(log_level, "[%s] %s", error.category.name, error.message)
+            
+            if error.original_error:
+                logger.log(log_level, "Original error: %s", error.original_error)
         
         # ユーザー通知
-        if error.severity in [ErrorSeverity.MEDIUM, ErrorSeverity.HIGH] and user_context:
+        if error.severity in _NOTIFY_SEVERITIES and user_context:
             user_message = self._get_user_friendly_message(error)
             try:
                 await user_context.send(user_message)
             except Exception as send_error:
-                logger.warning(f"Failed to send user notification: {send_error}")
+                logger.warning("Failed to send user notification: %s", send_error)
         
         return True
     
@@ -174,10 +209,10 @@ class ErrorHandler:
         user_context: Optional[discord.abc.Messageable]
     ) -> bool:
         """Discord.py エラーを処理"""
-        self.error_stats[ErrorCategory.SYSTEM] += 1
+        self._bump(ErrorCategory.SYSTEM)
         
         if isinstance(error, discord.Forbidden):
-            logger.warning(f"Permission denied: {error}")
+            logger.warning("Permission denied: %s", error)
             if user_context:
                 try:
                     await user_context.send("権限が不足しています。管理者にお問い合わせください。")
@@ -185,10 +220,10 @@ class ErrorHandler:
                     pass
         
         elif isinstance(error, discord.NotFound):
-            logger.info(f"Resource not found: {error}")
+            logger.info("Resource not found: %s", error)
             
         elif isinstance(error, discord.HTTPException):
-            logger.error(f"Discord API error: {error}")
+            logger.error("Discord API error: %s", error)
             if user_context:
                 try:
                     await user_context.send("Discord APIエラーが発生しました。しばらくしてからお試しください。")
@@ -196,7 +231,8 @@ class ErrorHandler:
                     pass
         
         else:
-            logger.error(f"Discord error: {error}", exc_info=True)
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error("Discord error: %s", error, exc_info=True)
         
         return True
     
@@ -207,10 +243,13 @@ class ErrorHandler:
         user_context: Optional[discord.abc.Messageable]
     ) -> bool:
         """一般的なエラーを処理"""
-        self.error_stats[ErrorCategory.SYSTEM] += 1
+        self._bump(ErrorCategory.SYSTEM)
         
-        context_info = f" | Context: {context}" if context else ""
-        logger.error(f"Unhandled error: {error}{context_info}", exc_info=True)
+        if logger.isEnabledFor(logging.ERROR):
+            if context:
+                logger.error("Unhandled error: %s | Context: %s", error, context, exc_info=True)
+            else:
+                logger.error("Unhandled error: %s", error, exc_info=True)
         
         if user_context:
             try:
@@ -222,51 +261,37 @@ class ErrorHandler:
     
     def _get_user_friendly_message(self, error: YomiageError) -> str:
         """ユーザーフレンドリーなエラーメッセージを生成"""
-        if error.category == ErrorCategory.API:
-            return "音声合成サービスで問題が発生しました。しばらくしてからお試しください。"
-        
-        elif error.category == ErrorCategory.VOICE:
-            return "音声機能で問題が発生しました。ボイスチャンネルの状態をご確認ください。"
-        
-        elif error.category == ErrorCategory.NETWORK:
-            return "ネットワーク接続で問題が発生しました。しばらくしてからお試しください。"
-        
-        elif error.category == ErrorCategory.CACHE:
-            return "キャッシュ処理でエラーが発生しましたが、動作に影響はありません。"
-        
-        elif error.category == ErrorCategory.PERMISSION:
-            return "権限不足です。管理者に必要な権限の付与をお問い合わせください。"
-        
-        elif error.category == ErrorCategory.USER_INPUT:
+        if error.category == ErrorCategory.USER_INPUT:
             return f"入力エラー: {error.message}"
         
-        else:
-            return "システムエラーが発生しました。開発者に報告されました。"
+        return _CATEGORY_TO_USER_MSG.get(error.category, _DEFAULT_USER_MSG)
     
     def get_error_stats(self) -> Dict[str, Any]:
         """エラー統計情報を取得"""
-        total_errors = sum(self.error_stats.values())
+        total_errors = self._total_errors
+        error_stats = self.error_stats
         
         stats = {
             "total_errors": total_errors,
             "error_breakdown": {
-                category.value: count 
-                for category, count in self.error_stats.items()
+                value: error_stats[category]
+                for category, value in _CATEGORY_VALUES
             }
         }
         
         if total_errors > 0:
             stats["error_rates"] = {
-                category.value: round((count / total_errors) * 100, 1)
-                for category, count in self.error_stats.items()
-                if count > 0
+                value: round(error_stats[category] / total_errors * 100, 1)
+                for category, value in _CATEGORY_VALUES
+                if error_stats[category] > 0
             }
         
         return stats
     
     def reset_error_stats(self):
         """エラー統計をリセット"""
-        self.error_stats = {category: 0 for category in ErrorCategory}
+        self.error_stats = [0] * len(ErrorCategory)
+        self._total_errors = 0
         logger.info("Error statistics reset")
 
 
@@ -277,11 +302,14 @@ global_error_handler = ErrorHandler()
 def handle_error_sync(error: Exception, context: Optional[Dict[str, Any]] = None):
     """同期版エラーハンドラー（緊急用）"""
     try:
+        if not logger.isEnabledFor(logging.ERROR):
+            return
         if isinstance(error, YomiageError):
-            logger.error(f"[{error.category.value.upper()}] {error.message}")
+            logger.error("[%s] %s", error.category.name, error.message)
+        elif context:
+            logger.error("Unhandled error: %s | Context: %s", error, context, exc_info=True)
         else:
-            context_info = f" | Context: {context}" if context else ""
-            logger.error(f"Unhandled error: {error}{context_info}", exc_info=True)
+            logger.error("Unhandled error: %s", error, exc_info=True)
     except Exception as handler_error:
         print(f"Critical: Error handler failed: {handler_error}")
         print(f"Original error: {error}")
@@ -302,19 +330,21 @@ def handle_errors(
         user_notify: ユーザー通知の有無
     """
     def decorator(func):
+        @functools.wraps(func)
         async def wrapper(*args, **kwargs):
             try:
                 return await func(*args, **kwargs)
             except YomiageError:
                 raise  # YomiageError はそのまま再発生
             except Exception as e:
-                # 一般例外を YomiageError に変換
+                # 一般例外を YomiageError に変換（メッセージは参照時に生成）
                 yomiage_error = YomiageError(
-                    f"Error in {func.__name__}: {str(e)}",
+                    None,
                     severity=severity,
                     category=category,
                     original_error=e
                 )
-                raise yomiage_error
+                yomiage_error._fn_name = func.__name__
+                raise yomiage_error from e
         return wrapper
     return decorator
\ No newline at end of file
@@ -0,0 +1,36 @@
+"""ギルドごとの状態管理"""
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+import discord
+
+
+# 読み上げ待ちメッセージの最大数（ギルドごと）
+MAX_QUEUE_SIZE = 50
+
+
+@dataclass(slots=True)
+class GuildState:
+    """
+    ギルドごとのボイス接続・読み上げキューの状態
+    
+    ギルドIDごとに複数の辞書を引かずに済むよう、関連する状態を1つにまとめる。
+    """
+    
+    # 接続中のボイスクライアント
+    vc: Optional[discord.VoiceClient] = None
+    # 読み上げ待ちメッセージ（満杯時は最も古いものから破棄）
+    queue: deque = field(default_factory=lambda: deque(maxlen=MAX_QUEUE_SIZE))
+    # メッセージ追加の通知
+    event: asyncio.Event = field(default_factory=asyncio.Event)
+    # 合成済み音声の再生キュー（ワーカー起動時に作成）
+    play_queue: Optional[asyncio.Queue] = None
+    # 再生の排他制御（読み上げ・挨拶の再生が重ならないようにする）
+    play_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    # (合成ワーカー, 再生ワーカー)
+    tasks: Tuple[asyncio.Task, ...] = ()
+    # ボイスチャンネル接続中（読み上げ対象）かどうか
+    active: bool = False
@@ -0,0 +1,93 @@
+"""メモリ内LRUキャッシュ"""
+
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Any
+
+
+class BytesLRUCache:
+    """件数と合計バイト数で上限を設けたバイト列用LRUキャッシュ"""
+
+    def __init__(self, max_entries: int = 128, max_bytes: int = 16 * 1024 * 1024):
+        """
+        LRUキャッシュを初期化
+
+        Args:
+            max_entries: 最大保持件数
+            max_bytes: 最大合計サイズ（バイト）
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        # イベントループ上（シングルスレッド）でのみ使用するためロックは不要
+        self._entries: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self._total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """
+        キャッシュからデータを取得
+
+        Args:
+            key: キャッシュキー
+
+        Returns:
+            キャッシュされたデータ。存在しない場合は None
+        """
+        data = self._entries.get(key)
+        if data is not None:
+            self._entries.move_to_end(key)
+        return data
+
+    def put(self, key: Hashable, data: bytes):
+        """
+        データをキャッシュに追加（上限を超えた分は古い順に削除）
+
+        Args:
+            key: キャッシュキー
+            data: 保存するデータ
+        """
+        # 単体で上限を超えるデータはキャッシュしない
+        if len(data) > self.max_bytes:
+            return
+
+        self.pop(key)
+        self._entries[key] = data
+        self._total_bytes += len(data)
+
+        while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._total_bytes -= len(evicted)
+
+    def pop(self, key: Hashable) -> Optional[bytes]:
+        """
+        キャッシュからデータを削除
+
+        Args:
+            key: キャッシュキー
+
+        Returns:
+            削除したデータ。存在しない場合は None
+        """
+        data = self._entries.pop(key, None)
+        if data is not None:
+            self._total_bytes -= len(data)
+        return data
+
+    def clear(self):
+        """キャッシュを全削除"""
+        self._entries.clear()
+        self._total_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """キャッシュ統計情報を取得"""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "total_bytes": self._total_bytes,
+            "max_bytes": self.max_bytes
+        }
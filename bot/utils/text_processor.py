@@ -6,23 +6,32 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# 全角英数字・記号（U+FF01～U+FF5E）と全角スペースを半角に変換するテーブル
+# （文字単位の置換は正規表現を使わず str.translate の1パスで行う）
+_HALFWIDTH_TABLE = str.maketrans(
+    {code: code - 0xFEE0 for code in range(0xFF01, 0xFF5F)} | {0x3000: ' '}
+)
+
 
 class TextProcessor:
     """テキスト前処理クラス"""
     
     # URL検出用の正規表現パターン
+    # （スキーム以降の空白以外の文字をすべてURLとみなすため、1回の走査で置換できる）
     URL_PATTERN = re.compile(
-        r'https?://(?:[-\w.])+(?:\:[0-9]+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:\#(?:[\w.])*)?)?'
-        r'|ftp://(?:[-\w.])+(?:\:[0-9]+)?(?:/(?:[\w/_.])*)?',
+        r'(?:https?|ftp)://\S+',
         re.IGNORECASE
     )
     
-    # より簡単なURL検出パターン（念のため）
-    SIMPLE_URL_PATTERN = re.compile(
-        r'(?:https?|ftp)://[^\s]+',
-        re.IGNORECASE
+    # ASCII のみのテキスト用（Unicode の文字種判定を行わない分、照合が速い）
+    ASCII_URL_PATTERN = re.compile(
+        r'(?:https?|ftp)://\S+',
+        re.IGNORECASE | re.ASCII
     )
     
+    # Discord のメンション形式: <@123456789> または <@!123456789>
+    MENTION_PATTERN = re.compile(r'<@!?(\d+)>')
+    
     def __init__(self, max_length: int = 100):
         """
         テキストプロセッサを初期化
@@ -42,21 +51,30 @@ class TextProcessor:
         Returns:
             URL置換後のテキスト
         """
-        if not text:
+        # URLを含まないメッセージ（大半）は正規表現を実行しない
+        if not text or '://' not in text:
             return text
         
-        # メインパターンでURL置換
-        processed_text = self.URL_PATTERN.sub('URL', text)
-        
-        # 念のため、シンプルなパターンでも置換
-        processed_text = self.SIMPLE_URL_PATTERN.sub('URL', processed_text)
+        processed_text = self._url_pattern_for(text).sub('URL', text)
         
         # 置換が発生した場合はログ出力
         if processed_text != text:
-            logger.debug(f"URL replaced: '{text}' -> '{processed_text}'")
+            logger.debug("URL replaced: '%s' -> '%s'", text, processed_text)
         
         return processed_text
     
+    def _url_pattern_for(self, text: str) -> re.Pattern:
+        """
+        テキストに応じたURL検出パターンを取得
+        
+        Args:
+            text: 処理対象のテキスト
+            
+        Returns:
+            ASCII のみの場合は ASCII_URL_PATTERN、それ以外は URL_PATTERN
+        """
+        return self.ASCII_URL_PATTERN if text.isascii() else self.URL_PATTERN
+    
     def validate_text_length(self, text: str) -> bool:
         """
         テキスト長さを検証
@@ -111,9 +129,9 @@ class TextProcessor:
         if not text:
             return text
         
-        # 現在は絵文字・記号をそのまま保持するため、
-        # 特別な処理は行わない（APIに委任）
-        return text.strip()
+        # 全角英数字・記号を半角に正規化（全角URLの検出・キャッシュヒット率向上）
+        # 絵文字はそのまま保持（APIに委任）
+        return text.translate(_HALFWIDTH_TABLE).strip()
     
     def process_message_text(self, text: str) -> Optional[str]:
         """
@@ -128,23 +146,24 @@ class TextProcessor:
         if not text:
             return None
         
-        # 1. テキストクリーンアップ
-        processed = self.clean_text(text)
-        
-        # 2. URL置換
-        processed = self.replace_urls(processed)
+        # 各処理を個別のメソッドで呼ばず1回で処理（検証済みの条件は再チェックしない）
+        # 1. テキストクリーンアップ（clean_text と同じ処理）
+        processed = text.translate(_HALFWIDTH_TABLE).strip()
+        if not processed:
+            logger.debug("Text validation failed: empty text")
+            return None
         
-        # 3. 長さ制限
-        processed = self.truncate_text(processed)
+        # 2. URL置換（URLを含む場合のみ）
+        if '://' in processed:
+            processed = self._url_pattern_for(processed).sub('URL', processed)
         
-        # 4. 最終検証
-        if not self.validate_text_length(processed):
-            logger.debug(f"Text validation failed: '{text}' -> '{processed}'")
-            return None
+        # 3. 長さ制限（先頭は空白以外のため切り詰め後も空にはならない）
+        if len(processed) > self.max_length:
+            processed = processed[:self.max_length]
         
         # 処理内容をログ出力（デバッグ時のみ）
-        if processed != text:
-            logger.debug(f"Text processed: '{text}' -> '{processed}'")
+        if processed != text and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Text processed: '%s' -> '%s'", text, processed)
         
         return processed
     
@@ -158,11 +177,8 @@ class TextProcessor:
         Returns:
             表示名（現在は元の文字列をそのまま返す）
         """
-        # Discord のメンション形式: <@123456789> または <@!123456789>
-        mention_pattern = re.compile(r'<@!?(\d+)>')
-        
-        # 現在はそのまま返すが、将来的には実際のユーザー名に
-        # 変換する機能を実装予定
+        # 現在はそのまま返すが、将来的には MENTION_PATTERN で検出した
+        # ユーザーIDを実際のユーザー名に変換する機能を実装予定
         return text
     
     def get_processing_stats(self) -> dict:
@@ -174,5 +190,5 @@ class TextProcessor:
         """
         return {
             "max_length": self.max_length,
-            "url_pattern_count": 2,  # 使用している正規表現パターン数
+            "url_pattern_count": 1,  # 使用している正規表現パターン数
         }
\ No newline at end of file
@@ -5,12 +5,38 @@ import asyncio
 import logging
 from typing import Dict, Any, Optional, List
 import json
+from urllib.parse import urlencode, quote
+
+try:
+    import orjson  # 任意依存（インストールされている場合は高速な JSON デコードを使用）
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
 # エラーハンドラーのインポート
 from .error_handler import TTSAPIError, ErrorSeverity, ErrorCategory, handle_errors
+from .cache_manager import make_settings_key
+
+
+# JSON デコード関数（bytes をそのまま渡せる）
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+# デフォルトのTTS設定（指定された設定はこれに上書きするため、全キーが常に存在する）
+DEFAULT_TTS_SETTINGS: Dict[str, Any] = {
+    "model_id": 7,  # Omochi
+    "speaker_id": 0,
+    "style": "Neutral",
+    "sdp_ratio": 0.2,
+    "noise": 0.6,
+    "noisew": 0.8,
+    "length": 1.0,
+    "language": "JP",  # JP言語設定（EN設定はOmochiモデル非対応のため）
+    "auto_split": True,
+    "split_interval": 0.5
+}
 
 
 class TTSAPIClient:
@@ -20,7 +46,9 @@ class TTSAPIClient:
         self,
         api_url: str = "http://192.168.0.99:5000",
         timeout: float = 30.0,  # TTS処理時間を考慮して延長
-        default_settings: Optional[Dict[str, Any]] = None
+        default_settings: Optional[Dict[str, Any]] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        max_concurrency: int = 4
     ):
         """
         APIクライアントを初期化
@@ -29,45 +57,116 @@ class TTSAPIClient:
             api_url: APIのベースURL
             timeout: リクエストタイムアウト時間
             default_settings: デフォルトのTTS設定
+            session: 共有HTTPセッション（None の場合は自前で作成）
+            max_concurrency: 音声合成リクエストの同時実行数上限
         """
         self.api_url = api_url.rstrip('/')
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         
-        self.default_settings = default_settings or {
-            "model_id": 7,  # Omochi
-            "speaker_id": 0,
-            "style": "Neutral",
-            "sdp_ratio": 0.2,
-            "noise": 0.6,
-            "noisew": 0.8,
-            "length": 1.0,
-            "language": "JP",  # JP言語設定（EN設定はOmochiモデル非対応のため）
-            "auto_split": True,
-            "split_interval": 0.5
-        }
-        
-        # セッションは遅延初期化
-        self._session: Optional[aiohttp.ClientSession] = None
+        self.default_settings = {**DEFAULT_TTS_SETTINGS, **(default_settings or {})}
+        self._refresh_settings_cache()
+        
+        # 共有セッションが渡されない場合は start()（async with）で作成
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
+        
+        # TTSサーバーの過負荷を防ぐため同時リクエスト数を制限
+        self._request_semaphore = asyncio.Semaphore(max_concurrency)
+    
+    def _refresh_settings_cache(self):
+        """デフォルト設定から派生する値を再計算（設定変更時に呼び出す）"""
+        # 設定ハッシュを事前計算し、メッセージごとのシリアライズを省略
+        self.default_settings_key = make_settings_key(self.default_settings)
+        # テキスト・話者以外のクエリ文字列（リクエストごとのエンコードを省略）
+        self._static_query = self._build_static_query(self.default_settings)
+    
+    @staticmethod
+    def _build_static_query(settings: Dict[str, Any]) -> str:
+        """
+        音声合成リクエストのうち、リクエストごとに変わらないパラメータのクエリ文字列を生成
+        
+        Args:
+            settings: TTS設定
+            
+        Returns:
+            URLエンコード済みのクエリ文字列
+        """
+        # boolean値は文字列に変換する必要がある
+        return urlencode({
+            "sdp_ratio": settings["sdp_ratio"],
+            "noise": settings["noise"],
+            "noisew": settings["noisew"],
+            "length": settings["length"],
+            "language": settings["language"],
+            "auto_split": "true" if settings["auto_split"] else "false",
+            "split_interval": settings["split_interval"]
+        }, quote_via=quote)
+    
+    def update_default_settings(self, **settings):
+        """
+        デフォルトのTTS設定を更新
+        
+        Args:
+            **settings: 更新するTTS設定
+        """
+        self.default_settings.update(settings)
+        self._refresh_settings_cache()
+        logger.info(f"Default TTS settings updated: {settings}")
+    
+    @staticmethod
+    def create_session(timeout: Optional[aiohttp.ClientTimeout] = None) -> aiohttp.ClientSession:
+        """
+        コネクションプールを有効化したHTTPセッションを作成
+        
+        Args:
+            timeout: セッション全体のデフォルトタイムアウト
+            
+        Returns:
+            HTTPセッション
+        """
+        connector = aiohttp.TCPConnector(
+            limit=32,  # 総接続数制限
+            limit_per_host=8,  # ホスト単位接続数制限
+            ttl_dns_cache=300,  # 名前解決結果を5分間キャッシュ
+            force_close=False,  # レスポンス後も接続を再利用
+            keepalive_timeout=60,  # キープアライブ時間
+            enable_cleanup_closed=True  # 閉じられた接続の自動クリーンアップ
+        )
+        return aiohttp.ClientSession(
+            timeout=timeout or aiohttp.ClientTimeout(total=30.0),
+            connector=connector
+        )
+    
+    async def __aenter__(self) -> "TTSAPIClient":
+        """HTTPセッションを作成してクライアントを返す"""
+        await self.start()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        """セッションを閉じる"""
+        await self.close()
+    
+    async def start(self):
+        """HTTPセッションを作成（共有セッションが渡されている場合は何もしない）"""
+        if self._session is None:
+            self._session = self.create_session(self.timeout)
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """HTTPセッションを取得（遅延初期化）"""
-        if self._session is None or self._session.closed:
-            # コネクションプールを有効化してパフォーマンス向上
-            connector = aiohttp.TCPConnector(
-                limit=10,  # 総接続数制限
-                limit_per_host=5,  # ホスト単位接続数制限
-                keepalive_timeout=30,  # キープアライブ時間
-                enable_cleanup_closed=True  # 閉じられた接続の自動クリーンアップ
-            )
-            self._session = aiohttp.ClientSession(
-                timeout=self.timeout,
-                connector=connector
-            )
+        """
+        HTTPセッションを取得
+        
+        セッションは start() で1回だけ作成し、リクエストごとに作り直さない。
+        
+        Raises:
+            RuntimeError: start() の前に呼び出された場合
+        """
+        if self._session is None:
+            raise RuntimeError("TTSAPIClient is not started (use 'async with' or start())")
         return self._session
     
     async def close(self):
-        """セッションを閉じる"""
-        if self._session and not self._session.closed:
+        """セッションを閉じる（共有セッションは所有者が閉じる）"""
+        if self._owns_session and self._session and not self._session.closed:
             await self._session.close()
     
     async def get_models_info(self) -> List[Dict[str, Any]]:
@@ -82,11 +181,12 @@ class TTSAPIClient:
         """
         try:
             session = await self._get_session()
-            async with session.get(f"{self.api_url}/models/info") as response:
+            async with session.get(f"{self.api_url}/models/info", timeout=self.timeout) as response:
                 if response.status != 200:
                     raise TTSAPIError(f"Models info API error: {response.status}")
                 
-                data = await response.json()
+                # 本文を文字列に変換せず bytes のままデコード
+                data = _json_loads(await response.read())
                 logger.info(f"Models info retrieved: {len(data)} models")
                 return data
                 
@@ -140,48 +240,55 @@ class TTSAPIClient:
             logger.warning(f"Text too long ({len(text)} chars), truncating to 100")
             text = text[:100]
         
-        # デフォルト設定をベースに設定を構築
-        settings = self.default_settings.copy()
+        # デフォルト設定をベースに設定を構築（上書きがない場合はコピーしない）
+        settings = self.default_settings
+        static_query = self._static_query
+        if kwargs:
+            # その他の設定を上書きする場合は固定部分のクエリ文字列も作り直す
+            settings = {**settings, **kwargs}
+            static_query = self._build_static_query(settings)
         
         # 指定されたパラメータで上書き
-        if model_id is not None:
-            settings["model_id"] = model_id
-        if speaker_id is not None:
-            settings["speaker_id"] = speaker_id
-        if style is not None:
-            settings["style"] = style
-        
-        # その他の設定も上書き
-        settings.update(kwargs)
-        
-        # APIリクエストデータ
-        request_data = {
+        if model_id is None:
+            model_id = settings["model_id"]
+        if speaker_id is None:
+            speaker_id = settings["speaker_id"]
+        if style is None:
+            style = settings["style"]
+        
+        # Style-Bert-VITS2はクエリパラメータでリクエストを受け取る
+        # リクエストごとに変わるパラメータのみエンコードし、固定部分と連結する
+        variable_query = urlencode({
             "text": text,
-            **settings
-        }
+            "model_id": model_id,
+            "speaker_id": speaker_id,
+            "style": style
+        }, quote_via=quote)
+        url = f"{self.api_url}/voice?{variable_query}&{static_query}"
         
+        return await self._post_voice(url, text, settings)
+    
+    async def _post_voice(self, url: str, text: str, settings: Dict[str, Any]) -> bytes:
+        """
+        音声合成APIにリクエストを送信
+        
+        Args:
+            url: クエリ文字列を含むリクエストURL
+            text: 合成するテキスト（エラー情報用）
+            settings: TTS設定（エラー情報用）
+            
+        Returns:
+            音声データ（WAV形式のバイト列）
+            
+        Raises:
+            TTSAPIError: API呼び出しエラー
+        """
         try:
             session = await self._get_session()
             
-            # Style-Bert-VITS2はクエリパラメータでリクエストを受け取る
-            # boolean値は文字列に変換する必要がある
-            query_params = {
-                "text": text,
-                "model_id": settings["model_id"],
-                "speaker_id": settings["speaker_id"],
-                "style": settings.get("style", "Neutral"),
-                "sdp_ratio": settings.get("sdp_ratio", 0.2),
-                "noise": settings.get("noise", 0.6),
-                "noisew": settings.get("noisew", 0.8),
-                "length": settings.get("length", 1.0),
-                "language": settings.get("language", "JP"),
-                "auto_split": str(settings.get("auto_split", True)).lower(),
-                "split_interval": settings.get("split_interval", 0.5)
-            }
-            
-            async with session.post(
-                f"{self.api_url}/voice",
-                params=query_params
+            async with self._request_semaphore, session.post(
+                url,
+                timeout=self.timeout
             ) as response:
                 
                 if response.status != 200:
@@ -221,6 +328,29 @@ class TTSAPIClient:
                 original_error=e
             )
     
+    async def ping(self, timeout: float = 2.0) -> bool:
+        """
+        軽量なリクエストを送信して接続プールの接続を維持
+        
+        Args:
+            timeout: タイムアウト時間（秒）
+            
+        Returns:
+            サーバーが応答した場合 True
+        """
+        try:
+            session = await self._get_session()
+            async with session.get(
+                f"{self.api_url}/docs",
+                timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as response:
+                # 本文を読み切って接続をプールに戻す
+                await response.read()
+                return True
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.debug("TTS API keepalive failed: %s", e)
+            return False
+    
     async def test_connection(self) -> bool:
         """
         API接続をテスト
@@ -235,15 +365,3 @@ class TTSAPIClient:
         except TTSAPIError:
             logger.error("TTS API connection test failed")
             return False
-    
-    def __del__(self):
-        """デストラクタでセッションクローズを試行"""
-        if hasattr(self, '_session') and self._session and not self._session.closed:
-            # asyncio イベントループが実行中の場合のみクローズを試行
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    loop.create_task(self._session.close())
-            except RuntimeError:
-                # イベントループが実行中でない場合は何もしない
-                pass
\ No newline at end of file
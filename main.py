@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import os
+import queue
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
@@ -15,10 +16,21 @@ sys.path.insert(0, str(project_root))
 from bot.client import YomiageBotClient
 
 # ログ設定
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 
-def setup_logging(log_level: str = "INFO"):
-    """ログ設定をセットアップ"""
+def setup_logging(log_level: str = "INFO") -> QueueListener:
+    """
+    ログ設定をセットアップ
+    
+    ログ出力（コンソール・ファイル書き込み）はバックグラウンドスレッドで行い、
+    イベントループ側はキューへの追加のみで済むようにする。
+    
+    Args:
+        log_level: ログレベル
+        
+    Returns:
+        ログ出力スレッドのリスナー（終了時に stop() を呼び出す）
+    """
     # ログディレクトリを作成
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
@@ -30,22 +42,40 @@ def setup_logging(log_level: str = "INFO"):
     # ログレベル設定
     level = getattr(logging, log_level.upper(), logging.INFO)
     
+    # 書式で使用しないスレッド・プロセス情報の取得をログレコードごとに行わない
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    
+    # 出力先ハンドラー（リスナースレッドで実行）
+    formatter = logging.Formatter(log_format, datefmt=date_format)
+    output_handlers = [
+        # コンソール出力
+        logging.StreamHandler(sys.stdout),
+        # ファイル出力（ローテーション対応）
+        RotatingFileHandler(
+            log_dir / "yomiage.log",
+            maxBytes=10*1024*1024,  # 10MB
+            backupCount=9,  # 10件保持（現在+過去9件）
+            encoding='utf-8'
+        )
+    ]
+    for handler in output_handlers:
+        handler.setFormatter(formatter)
+    
+    # ルートロガーはキューに追加するだけ（書き込み待ちでブロックしない）
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *output_handlers, respect_handler_level=True)
+    listener.start()
+    
+    # 書式は出力先ハンドラー側で適用（キューにはメッセージ本文のみを渡す）
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    
     # ルートロガー設定
     logging.basicConfig(
         level=level,
-        format=log_format,
-        datefmt=date_format,
-        handlers=[
-            # コンソール出力
-            logging.StreamHandler(sys.stdout),
-            # ファイル出力（ローテーション対応）
-            RotatingFileHandler(
-                log_dir / "yomiage.log",
-                maxBytes=10*1024*1024,  # 10MB
-                backupCount=9,  # 10件保持（現在+過去9件）
-                encoding='utf-8'
-            )
-        ]
+        handlers=[queue_handler]
     )
     
     # Discord.py のログレベルを調整（INFOレベルのみ）
@@ -57,6 +87,7 @@ def setup_logging(log_level: str = "INFO"):
     http_logger.setLevel(logging.WARNING)
     
     logging.info("Logging setup completed with rotation (10MB per file, 10 files max)")
+    return listener
 
 
 def cleanup_old_logs(log_dir_path: Path, max_files: int = 10):
@@ -123,10 +154,11 @@ def load_environment():
 
 async def main():
     """メイン関数"""
+    log_listener = None
     try:
         # ロギング設定
         log_level = os.getenv('LOG_LEVEL', 'INFO')
-        setup_logging(log_level)
+        log_listener = setup_logging(log_level)
         
         # 起動時にログファイルクリーンアップ
         log_dir = Path("logs")
@@ -170,6 +202,10 @@ async def main():
     
     finally:
         logging.info("YomiageBot Alpha shutdown completed")
+        
+        # キューに残ったログを出力してからリスナーを停止
+        if log_listener is not None:
+            log_listener.stop()
 
 
 if __name__ == "__main__":